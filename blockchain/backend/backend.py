@@ -4,17 +4,20 @@ from typing import Dict, List, Optional, Any, Union
 import numpy as np
 import time
 import hashlib
-import json
 import os
 import logging
 import requests
-import threading
+import orjson
+from requests.adapters import HTTPAdapter
 import asyncio
 import base64
+import functools
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Import optimization engines
-from optimization import optimization_engine
+from optimization import get_engine
 try:
     from quantum_integration import quantum_engine, QUANTUM_AVAILABLE
 except ImportError:
@@ -25,6 +28,13 @@ except ImportError:
 # Import gas optimizer
 from gas_optimizer import gas_optimizer
 
+# Optional BLAKE3 hashing for contours
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 # Add error handling for startup
 import os
 import sys
@@ -59,19 +69,67 @@ except Exception as e:
     logger.critical(f"Critical error during startup: {str(e)}")
     sys.exit(1)
 
+# Number of t values each Bezier contour is sampled at
+_BEZIER_SAMPLES = 100
+# Highest Bezier degree evaluated; longer point lists are subsampled so the
+# cost of a contour does not grow with the size of the input
+MAX_BEZIER_DEGREE = 32
+# Above this degree the binomial coefficients lose precision, so longer
+# curves fall back to de Casteljau; only a GeometricProcessor built with
+# max_degree=None (or a cap above this) can get there
+_BERNSTEIN_MAX_DEGREE = 64
+
+@functools.lru_cache(maxsize=None)
+def _bernstein(degree):
+    """Bernstein basis matrix of shape (_BEZIER_SAMPLES, degree + 1)"""
+    t = np.linspace(0, 1, _BEZIER_SAMPLES)[:, None]
+    k = np.arange(degree + 1)
+    coeffs = np.array([math.comb(degree, i) for i in k], dtype=np.float64)
+    basis = coeffs * t**k * (1 - t)**(degree - k)
+    basis.flags.writeable = False
+    return basis
+
 # Simulate geometric processing
 class GeometricProcessor:
-    def __init__(self, dimensions=3, precision=0.01):
+    def __init__(self, dimensions=3, precision=0.01, max_degree=MAX_BEZIER_DEGREE):
         self.dimensions = dimensions
         self.precision = precision
-        self.points = []
+        self.max_degree = max_degree
+        # Contiguous (capacity, dimensions) arena, grown by doubling
+        self._points_arr = np.empty((0, dimensions), dtype=np.float64)
+        self._n_points = 0
+    
+    @property
+    def points(self):
+        # (n, dimensions) float64 view of the stored points
+        return self._points_arr[:self._n_points]
     
     def add_point(self, point):
         if len(point) != self.dimensions:
             raise ValueError(f"Point must have {self.dimensions} dimensions")
-        self.points.append(point)
+        self._reserve(self._n_points + 1)
+        self._points_arr[self._n_points] = point
+        self._n_points += 1
+        return self
+    
+    def add_points(self, points):
+        # Bulk version of add_point for an (n, dimensions) array or list of points
+        points = np.asarray(points, dtype=np.float64)
+        if points.size == 0:
+            return self
+        if points.ndim != 2 or points.shape[1] != self.dimensions:
+            raise ValueError(f"Point must have {self.dimensions} dimensions")
+        self._reserve(self._n_points + len(points))
+        self._points_arr[self._n_points:self._n_points + len(points)] = points
+        self._n_points += len(points)
         return self
     
+    def _reserve(self, capacity):
+        if capacity > len(self._points_arr):
+            grown = np.empty((max(8, 2 * len(self._points_arr), capacity), self.dimensions), dtype=np.float64)
+            grown[:self._n_points] = self.points
+            self._points_arr = grown
+    
     def compute_contour(self, algorithm="bezier"):
         # Simulate contour computation
         if algorithm == "bezier":
@@ -85,31 +143,56 @@ class GeometricProcessor:
     
     def _compute_bezier(self):
         # Simulate Bezier curve computation
-        if len(self.points) < 2:
-            return []
+        points = self.points
+        if len(points) < 2:
+            return np.empty((0, self.dimensions))
+        
+        # Keep evenly spaced control points (including both ends) when the
+        # curve would exceed the degree ceiling
+        if self.max_degree is not None and len(points) > self.max_degree + 1:
+            points = points[np.linspace(0, len(points) - 1, self.max_degree + 1).astype(int)]
         
-        t_values = np.linspace(0, 1, 100)
-        curve = []
+        t = np.linspace(0, 1, _BEZIER_SAMPLES)
         
-        for t in t_values:
-            point = self._bezier_point(self.points, t)
-            curve.append(point)
+        # Closed-form Bernstein polynomials for linear, quadratic and cubic curves
+        if len(points) == 2:
+            curve = points[0] + t[:, None] * (points[1] - points[0])
+        elif len(points) == 3:
+            mt = 1 - t
+            curve = ((mt * mt)[:, None] * points[0]
+                     + (2 * t * mt)[:, None] * points[1]
+                     + (t * t)[:, None] * points[2])
+        elif len(points) == 4:
+            mt = 1 - t
+            curve = ((mt * mt * mt)[:, None] * points[0]
+                     + (3 * t * mt * mt)[:, None] * points[1]
+                     + (3 * t * t * mt)[:, None] * points[2]
+                     + (t * t * t)[:, None] * points[3])
+        elif len(points) <= _BERNSTEIN_MAX_DEGREE + 1:
+            # Weighted sum of the points with the cached basis for this degree;
+            # a plain reduction instead of BLAS keeps the result bit-identical
+            # across machines, which the contour hash relies on
+            basis = _bernstein(len(points) - 1)
+            curve = (basis[:, :, None] * points).sum(axis=1)
+        else:
+            # Uncapped curves above the Bernstein limit only (max_degree=None);
+            # evaluate every t value in a single vectorized pass
+            curve = self._bezier_point(points, t[:, None, None])
         
         return curve
     
     def _bezier_point(self, points, t):
-        if len(points) == 1:
-            return points[0]
-        
-        new_points = []
-        for i in range(len(points) - 1):
-            new_point = [
-                (1 - t) * points[i][d] + t * points[i + 1][d]
-                for d in range(self.dimensions)
-            ]
-            new_points.append(new_point)
+        # De Casteljau on an (n, dimensions) array for a column of t values,
+        # reduced in place so each level reuses the same two buffers
+        levels = np.repeat(points[None], len(t), axis=0)
+        scratch = np.empty_like(levels)
+        for k in range(len(points) - 1, 0, -1):
+            step = scratch[:, :k]
+            np.subtract(levels[:, 1:k + 1], levels[:, :k], out=step)
+            step *= t
+            levels[:, :k] += step
         
-        return self._bezier_point(new_points, t)
+        return levels[:, 0]
     
     def _compute_spline(self):
         # Simulate spline computation
@@ -125,55 +208,49 @@ class GeometricVerifier:
         self.dimensions = dimensions
         self.precision = precision
         self.tolerance = tolerance
-        self.processor = GeometricProcessor(dimensions, precision)
     
     def verify_signature(self, data, signature):
+        # Hash the data first; it is cheap next to the contour
+        data_bytes = data if isinstance(data, bytes) else str(data).encode()
+        data_prefix = hashlib.sha256(data_bytes).hexdigest()[:5]
+        
         # Convert signature to points
         points = self._signature_to_points(signature)
         
-        # Add points to processor
-        for point in points:
-            self.processor.add_point(point)
+        # Fewer than two points always give the empty contour, whose hash is
+        # fixed, so short or malformed signatures skip the processor entirely
+        if len(points) < 2:
+            return _EMPTY_CONTOUR_HASH.startswith(data_prefix)
+        
+        # Use a fresh processor so points never carry over between
+        # verifications and concurrent calls do not share state
+        processor = GeometricProcessor(self.dimensions, self.precision)
+        processor.add_points(points)
         
         # Compute contour
-        contour = self.processor.compute_contour("bezier")
+        contour = processor.compute_contour("bezier")
         
         # Verify contour matches data
-        return self._verify_contour(contour, data)
+        return self._verify_contour(contour, data_prefix)
     
     def _signature_to_points(self, signature):
         # Convert signature bytes to points
-        points = []
         bytes_per_point = self.dimensions * 4  # 4 bytes per float
+        n_values = (len(signature) // bytes_per_point) * self.dimensions
         
-        for i in range(0, len(signature), bytes_per_point):
-            if i + bytes_per_point <= len(signature):
-                point = []
-                for d in range(self.dimensions):
-                    # Extract 4 bytes and convert to float
-                    byte_offset = i + d * 4
-                    value_bytes = signature[byte_offset:byte_offset + 4]
-                    if len(value_bytes) == 4:
-                        # Convert bytes to integer, then scale to [-1, 1]
-                        value_int = int.from_bytes(value_bytes, byteorder='big')
-                        value = (value_int / 2**32) * 2 - 1
-                        point.append(value)
-                
-                if len(point) == self.dimensions:
-                    points.append(point)
+        # Read big-endian 32-bit integers, then scale to [-1, 1]
+        values = np.frombuffer(signature, dtype='>u4', count=n_values).astype(np.float64)
+        values = values * (2.0 / 2**32) - 1.0
         
-        return points
+        return values.reshape(-1, self.dimensions)
     
-    def _verify_contour(self, contour, data):
+    def _verify_contour(self, contour, data_prefix):
         # Hash the contour
-        contour_hash = self._hash_contour(contour)
-        
-        # Hash the data
-        data_hash = hashlib.sha256(str(data).encode()).hexdigest()
+        contour_hash = _hash_contour(contour)
         
         # Compare hashes (simplified verification)
         # In a real implementation, this would be more sophisticated
-        return contour_hash.startswith(data_hash[:5])
+        return contour_hash.startswith(data_prefix)
 
 # Setup logging
 logging.basicConfig(
@@ -192,39 +269,67 @@ geometric_verifier = GeometricVerifier(dimensions=3, precision=0.01, tolerance=0
 # Java backend integration
 JAVA_BACKEND_URL = os.environ.get("JAVA_BACKEND_URL", "http://localhost:8080/kontourcoin/api/v1")
 
+# Contour hash scheme ("sha256" or "blake3"); it is part of the on-wire
+# contour hash, so every node must use the same setting
+CONTOUR_HASH_ALGORITHM = os.environ.get("CONTOUR_HASH_ALGORITHM", "sha256").lower()
+if CONTOUR_HASH_ALGORITHM not in ("sha256", "blake3"):
+    raise ValueError(f"Unknown CONTOUR_HASH_ALGORITHM: {CONTOUR_HASH_ALGORITHM}")
+if CONTOUR_HASH_ALGORITHM == "blake3" and not BLAKE3_AVAILABLE:
+    logger.warning("blake3 not available. Falling back to SHA-256 contour hashes.")
+    CONTOUR_HASH_ALGORITHM = "sha256"
+
+# Input size limits for verification requests
+MAX_SIGNATURE_BYTES = 1024
+MAX_CONTOUR_POINTS = 1000
+MAX_BATCH_TRANSACTIONS = 256
+
 # Background task queue
 background_tasks = []
+# Each task writes only its own key; single-key dict reads and writes are
+# atomic in CPython, so no global lock is needed
 task_results = {}
-task_lock = threading.Lock()
+
+# Worker pool for CPU-bound verification (NumPy and hashlib release the GIL)
+verification_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Shared HTTP session so Java backend calls reuse keep-alive connections
+def _create_java_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 # Java backend integration class
 class JavaBackendClient:
-    @staticmethod
-    def get_blockchain_info():
+    _session = _create_java_session()
+    
+    @classmethod
+    def get_blockchain_info(cls):
         try:
-            response = requests.get(f"{JAVA_BACKEND_URL}/blockchain", timeout=5)
+            response = cls._session.get(f"{JAVA_BACKEND_URL}/blockchain", timeout=5)
             return response.json() if response.status_code == 200 else None
         except Exception as e:
             logger.error(f"Error getting blockchain info from Java backend: {str(e)}")
             return None
     
-    @staticmethod
-    def get_stats():
+    @classmethod
+    def get_stats(cls):
         try:
-            response = requests.get(f"{JAVA_BACKEND_URL}/stats", timeout=5)
+            response = cls._session.get(f"{JAVA_BACKEND_URL}/stats", timeout=5)
             return response.json() if response.status_code == 200 else None
         except Exception as e:
             logger.error(f"Error getting stats from Java backend: {str(e)}")
             return None
     
-    @staticmethod
-    def add_transaction(transaction_data):
+    @classmethod
+    def add_transaction(cls, transaction_data):
         try:
             # Convert signature to base64
             if isinstance(transaction_data.get("signature"), bytes):
                 transaction_data["signature"] = base64.b64encode(transaction_data["signature"]).decode()
             
-            response = requests.post(
+            response = cls._session.post(
                 f"{JAVA_BACKEND_URL}/transactions",
                 json=transaction_data,
                 timeout=5
@@ -234,10 +339,10 @@ class JavaBackendClient:
             logger.error(f"Error adding transaction to Java backend: {str(e)}")
             return None
     
-    @staticmethod
-    def verify_transaction(tx_hash):
+    @classmethod
+    def verify_transaction(cls, tx_hash):
         try:
-            response = requests.post(
+            response = cls._session.post(
                 f"{JAVA_BACKEND_URL}/transactions/{tx_hash}/verify",
                 timeout=5
             )
@@ -246,10 +351,10 @@ class JavaBackendClient:
             logger.error(f"Error verifying transaction in Java backend: {str(e)}")
             return None
     
-    @staticmethod
-    def verify_contour(contour_data):
+    @classmethod
+    def verify_contour(cls, contour_data):
         try:
-            response = requests.post(
+            response = cls._session.post(
                 f"{JAVA_BACKEND_URL}/contours/verify",
                 json=contour_data,
                 timeout=5
@@ -259,8 +364,8 @@ class JavaBackendClient:
             logger.error(f"Error verifying contour in Java backend: {str(e)}")
             return None
     
-    @staticmethod
-    def mine_block(block_data):
+    @classmethod
+    def mine_block(cls, block_data):
         try:
             # Convert binary data to base64
             if isinstance(block_data.get("merkleRoot"), bytes):
@@ -268,7 +373,7 @@ class JavaBackendClient:
             if isinstance(block_data.get("contourHash"), bytes):
                 block_data["contourHash"] = base64.b64encode(block_data["contourHash"]).decode()
             
-            response = requests.post(
+            response = cls._session.post(
                 f"{JAVA_BACKEND_URL}/mine",
                 json=block_data,
                 timeout=10
@@ -281,20 +386,19 @@ class JavaBackendClient:
 # Background task handler
 async def run_background_task(task_id, func, *args, **kwargs):
     try:
-        result = func(*args, **kwargs)
-        with task_lock:
-            task_results[task_id] = {
-                "status": "completed",
-                "result": result,
-                "timestamp": datetime.now().isoformat()
-            }
+        # Run the blocking call in a worker thread to keep the event loop free
+        result = await asyncio.to_thread(func, *args, **kwargs)
+        task_results[task_id] = {
+            "status": "completed",
+            "result": result,
+            "timestamp": datetime.now().isoformat()
+        }
     except Exception as e:
-        with task_lock:
-            task_results[task_id] = {
-                "status": "failed",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
+        task_results[task_id] = {
+            "status": "failed",
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }
 
 # Java backend client instance
 java_client = JavaBackendClient()
@@ -318,6 +422,8 @@ class TransactionVerificationResponse(BaseModel):
     geometric_proof: str
     verification_time: float
     complexity: float
+    # Why verification could not run; only set for failed items of a batch
+    error: Optional[str] = None
 
 class ContourSubmission(BaseModel):
     miner_address: str
@@ -333,23 +439,26 @@ class ContourVerificationResponse(BaseModel):
 # Simulated transaction database
 verified_transactions = {}
 
+def _canonical_tx_bytes(tx: dict) -> bytes:
+    """Serialize transaction data to canonical (sorted-key, compact) JSON bytes"""
+    return orjson.dumps(tx, option=orjson.OPT_SORT_KEYS)
+
 # Geometric hash function
-def geometric_hash(data: str) -> str:
-    """Compute a geometric hash based on the input data"""
-    # Create a deterministic set of points from the data
-    points = []
-    for i in range(0, len(data), 3):
-        if i + 2 < len(data):
-            # Use three characters to create a 3D point
-            x = (ord(data[i]) / 255) * 2 - 1
-            y = (ord(data[i+1]) / 255) * 2 - 1
-            z = (ord(data[i+2]) / 255) * 2 - 1
-            points.append([x, y, z])
+# Pure in its input, so replayed and re-checked transactions reuse the result
+@functools.lru_cache(maxsize=4096)
+def geometric_hash(data: bytes) -> str:
+    """Compute a geometric hash based on the input bytes"""
+    if isinstance(data, str):
+        data = data.encode()
+    
+    # Create a deterministic set of points from the data: every three bytes
+    # form a 3D point scaled to [-1, 1], trailing bytes are dropped
+    values = np.frombuffer(data, dtype=np.uint8, count=(len(data) // 3) * 3)
+    points = values.reshape(-1, 3) * (2.0 / 255) - 1.0
     
     # Create a geometric processor and add points
     processor = GeometricProcessor(dimensions=3, precision=0.01)
-    for point in points:
-        processor.add_point(point)
+    processor.add_points(points)
     
     # Compute contour
     contour = processor.compute_contour("bezier")
@@ -361,16 +470,17 @@ def geometric_hash(data: str) -> str:
     return "gh:" + contour_hash
 
 def _hash_contour(contour):
-    """Hash a contour (list of points)"""
-    # Convert contour to string
-    contour_str = json.dumps(contour)
+    """Hash a contour (array or list of points)"""
+    # Use the raw float64 bytes of the points
+    contour_bytes = np.ascontiguousarray(contour, dtype=np.float64).tobytes()
     
-    # Hash the string
-    sha256 = hashlib.sha256()
-    sha256.update(contour_str.encode())
+    if CONTOUR_HASH_ALGORITHM == "blake3":
+        return blake3.blake3(contour_bytes).hexdigest()
     
-    # Return the hash
-    return sha256.hexdigest()
+    # Hash the bytes
+    return hashlib.sha256(contour_bytes).hexdigest()
+
+_EMPTY_CONTOUR_HASH = _hash_contour([])
 
 # Transaction prioritization based on geometric complexity
 def prioritize_transaction(tx: Transaction) -> float:
@@ -389,12 +499,11 @@ def prioritize_transaction(tx: Transaction) -> float:
         return 0.5  # Default priority
     
     # Calculate average distance between consecutive points
-    total_distance = 0
-    for i in range(len(points) - 1):
-        distance = sum((points[i][d] - points[i+1][d])**2 for d in range(len(points[i])))
-        total_distance += np.sqrt(distance)
-    
-    avg_distance = total_distance / (len(points) - 1) if len(points) > 1 else 0
+    if len(points) > 1:
+        total_distance = np.linalg.norm(np.diff(points, axis=0), axis=1).sum()
+        avg_distance = total_distance / (len(points) - 1)
+    else:
+        avg_distance = 0
     
     # Calculate complexity score (0-1)
     # More points and higher average distance = higher complexity
@@ -409,22 +518,59 @@ async def root():
 @app.post("/verify-transaction", response_model=TransactionVerificationResponse)
 async def verify_transaction(request: TransactionVerificationRequest):
     """Verify a transaction using geometric algorithms"""
+    return _verify_sync(request)
+
+@app.post("/verify-transactions-batch", response_model=List[TransactionVerificationResponse])
+async def verify_transactions_batch(batch: List[TransactionVerificationRequest]):
+    """Verify a batch of transactions in parallel on the verification pool"""
+    if len(batch) > MAX_BATCH_TRANSACTIONS:
+        raise HTTPException(status_code=400, detail=f"Batch exceeds {MAX_BATCH_TRANSACTIONS} transactions")
+    
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(verification_pool, _verify_sync, request)
+        for request in batch
+    ), return_exceptions=True)
+    
+    # A transaction that cannot be verified fails on its own instead of
+    # discarding the results of the rest of the batch
+    return [
+        _failed_verification(request, result) if isinstance(result, Exception) else result
+        for request, result in zip(batch, results)
+    ]
+
+def _failed_verification(request: TransactionVerificationRequest, error: Exception) -> TransactionVerificationResponse:
+    """Batch result for a transaction whose verification raised"""
+    return TransactionVerificationResponse(
+        transaction_hash=request.transaction_hash,
+        verified=False,
+        geometric_proof="",
+        verification_time=0.0,
+        complexity=0.0,
+        error=error.detail if isinstance(error, HTTPException) else str(error)
+    )
+
+def _verify_sync(request: TransactionVerificationRequest) -> TransactionVerificationResponse:
+    """Synchronous core of transaction verification"""
     start_time = time.time()
     
+    if len(request.transaction_data.signature.replace("0x", "")) > 2 * MAX_SIGNATURE_BYTES:
+        raise HTTPException(status_code=400, detail=f"Signature exceeds {MAX_SIGNATURE_BYTES} bytes")
+    
     try:
         # Log transaction
         logger.info(f"Verifying transaction: {request.transaction_hash}")
         
-        # Convert transaction to string for hashing
-        tx_string = json.dumps(request.transaction_data.dict(), sort_keys=True)
+        # Convert transaction to canonical bytes for hashing
+        tx_bytes = _canonical_tx_bytes(request.transaction_data.dict())
         
         # Generate geometric hash
-        geometric_hash_value = geometric_hash(tx_string)
+        geometric_hash_value = geometric_hash(tx_bytes)
         
         # Verify signature using geometric verification
         try:
             signature_bytes = bytes.fromhex(request.transaction_data.signature.replace("0x", ""))
-            is_valid = geometric_verifier.verify_signature(tx_string, signature_bytes)
+            is_valid = geometric_verifier.verify_signature(tx_bytes, signature_bytes)
         except Exception as e:
             logger.warning(f"Error verifying signature: {str(e)}")
             # Fallback verification for testing
@@ -460,6 +606,9 @@ async def verify_contour(submission: ContourSubmission):
     """Verify a geometric contour for PoC mining"""
     start_time = time.time()
     
+    if len(submission.contour_points) > MAX_CONTOUR_POINTS:
+        raise HTTPException(status_code=400, detail=f"Contour exceeds {MAX_CONTOUR_POINTS} points")
+    
     try:
         # Log contour submission
         logger.info(f"Verifying contour from miner: {submission.miner_address}")
@@ -468,8 +617,7 @@ async def verify_contour(submission: ContourSubmission):
         processor = GeometricProcessor(dimensions=3, precision=0.01)
         
         # Add points to processor
-        for point in submission.contour_points:
-            processor.add_point(point)
+        processor.add_points(submission.contour_points)
         
         # Compute contour
         contour = processor.compute_contour(submission.algorithm)
@@ -525,7 +673,7 @@ async def get_stats():
     }
     
     # Try to get Java backend stats
-    java_stats = java_client.get_stats()
+    java_stats = await asyncio.to_thread(java_client.get_stats)
     if java_stats:
         stats["java_backend"] = java_stats
     
@@ -534,7 +682,7 @@ async def get_stats():
 @app.get("/blockchain")
 async def get_blockchain():
     """Get blockchain information from Java backend"""
-    blockchain_info = java_client.get_blockchain_info()
+    blockchain_info = await asyncio.to_thread(java_client.get_blockchain_info)
     if not blockchain_info:
         raise HTTPException(status_code=503, detail="Java backend not available")
     return blockchain_info
@@ -631,6 +779,7 @@ class ContractCode(BaseModel):
 class OptimizationRequest(BaseModel):
     code: str
     level: str = "balanced"
+    reanalyze: bool = True
 
 class SavingsEstimateRequest(BaseModel):
     gasSaved: int
@@ -652,7 +801,7 @@ async def analyze_contract(data: ContractCode):
 async def optimize_contract(data: OptimizationRequest):
     """Optimize a smart contract for gas usage"""
     try:
-        result = gas_optimizer.optimize_contract(data.code, data.level)
+        result = gas_optimizer.optimize_contract(data.code, data.level, data.reanalyze)
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -681,16 +830,15 @@ async def sync_block(block_data: dict):
     logger.info(f"Syncing block: {block_data.get('index')}")
     
     # Store block data
-    with task_lock:
-        task_results[task_id] = {
-            "status": "completed",
-            "result": {
-                "block_index": block_data.get('index'),
-                "synced": True,
-                "timestamp": datetime.now().isoformat()
-            },
+    task_results[task_id] = {
+        "status": "completed",
+        "result": {
+            "block_index": block_data.get('index'),
+            "synced": True,
             "timestamp": datetime.now().isoformat()
-        }
+        },
+        "timestamp": datetime.now().isoformat()
+    }
     
     return {
         "task_id": task_id,
@@ -718,11 +866,10 @@ async def sync_transaction(request: TransactionVerificationRequest, background_t
     }
     
     # Add background task to sync with Java backend
-    with task_lock:
-        task_results[task_id] = {
-            "status": "pending",
-            "timestamp": datetime.now().isoformat()
-        }
+    task_results[task_id] = {
+        "status": "pending",
+        "timestamp": datetime.now().isoformat()
+    }
     
     # Run in background
     background_tasks.add_task(
@@ -752,11 +899,10 @@ async def sync_contour(submission: ContourSubmission, background_tasks: Backgrou
     }
     
     # Add background task to sync with Java backend
-    with task_lock:
-        task_results[task_id] = {
-            "status": "pending",
-            "timestamp": datetime.now().isoformat()
-        }
+    task_results[task_id] = {
+        "status": "pending",
+        "timestamp": datetime.now().isoformat()
+    }
     
     # Run in background
     background_tasks.add_task(
@@ -777,11 +923,10 @@ async def mine_block(block_data: dict, background_tasks: BackgroundTasks):
     task_id = f"mine-block-{block_data.get('minerAddress', 'unknown')}-{int(time.time())}"
     
     # Add background task to mine block
-    with task_lock:
-        task_results[task_id] = {
-            "status": "pending",
-            "timestamp": datetime.now().isoformat()
-        }
+    task_results[task_id] = {
+        "status": "pending",
+        "timestamp": datetime.now().isoformat()
+    }
     
     # Run in background
     background_tasks.add_task(
@@ -800,10 +945,10 @@ async def mine_block(block_data: dict, background_tasks: BackgroundTasks):
 @app.get("/tasks/{task_id}")
 async def get_task_status(task_id: str):
     """Get status of a background task"""
-    with task_lock:
-        if task_id not in task_results:
-            raise HTTPException(status_code=404, detail="Task not found")
-        return task_results[task_id]
+    task = task_results.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
 
 if __name__ == "__main__":
     import uvicorn
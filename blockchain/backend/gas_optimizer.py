@@ -5,12 +5,251 @@ Provides tools for analyzing and optimizing gas usage in smart contracts
 
 import re
 import json
+import copy
 import logging
+import functools
+import collections
+import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
 
+# Optional linear-time regex engine for the gas cost scanner
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional JIT compilation for batch savings estimates
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger("kontourcoin-gas-optimizer")
 
+# Solidity source is scanned as UTF-8 bytes, which is faster than str
+# matching; surrogatepass keeps any str input encodable and round-trippable
+_SOURCE_ENCODING = "utf-8"
+_SOURCE_ERRORS = "surrogatepass"
+
+# Number of analysis and optimization results kept per optimizer
+_RESULT_CACHE_SIZE = 256
+
+# Regular expression to match function declarations up to the opening brace;
+# the body is found by scanning for the matching closing brace
+_FUNCTION_HEADER_REGEX = re.compile(rb"function\s+(\w+)\s*\(([^)]*)\)\s*(public|private|internal|external)?\s*(view|pure|payable)?\s*(?:returns\s*\(([^)]*)\))?\s*\{")
+
+# Braces, plus the string literals and comments whose braces must be skipped
+_BRACE_TOKEN_REGEX = re.compile(rb'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|//[^\n]*|/\*.*?(?:\*/|\Z)|[{}]', re.S)
+
+# Gas cost patterns
+_GAS_COST_PATTERNS = {
+    "storage_write": {
+        "pattern": r"\w+\s*=\s*",
+        "literal": "=",
+        "cost": 5000
+    },
+    "storage_read": {
+        "pattern": r"\w+\[\w+\]",
+        "literal": "[",
+        "cost": 800
+    },
+    "external_call": {
+        "pattern": r"\.\w+\(",
+        "literal": ".",
+        "cost": 2500
+    },
+    "event_emit": {
+        "pattern": r"emit\s+\w+",
+        "literal": "emit",
+        "cost": 1500
+    },
+    "require": {
+        "pattern": r"require\(",
+        "literal": "require(",
+        "cost": 200
+    },
+    "loop": {
+        "pattern": r"for\s*\(",
+        "literal": "for",
+        "cost": 300
+    }
+}
+
+# All gas cost patterns fused into one alternation so each body is scanned once;
+# compiled with RE2 when available since the patterns need no backtracking
+_GAS_COST_RE = (re2 if RE2_AVAILABLE else re).compile("|".join(
+    f"(?P<{name}>{info['pattern']})" for name, info in _GAS_COST_PATTERNS.items()
+).encode())
+
+# Gas costs indexed by group number - 1; the patterns have no inner groups,
+# so a match's lastindex identifies the alternative that matched
+_GAS_COSTS_ARR = np.array([info["cost"] for info in _GAS_COST_PATTERNS.values()], dtype=np.int64)
+
+# Literal every gas cost match must contain, used to skip bodies cheaply
+_GAS_COST_LITERALS = tuple(info["literal"].encode() for info in _GAS_COST_PATTERNS.values())
+
+# Suggestion patterns
+_SUGGESTION_PATTERNS = [
+    {
+        "pattern": r"for\s*\(\s*\w+\s+\w+\s*=\s*0\s*;\s*\w+\s*<\s*(\w+)\.length\s*;\s*\w+\s*\+\+\s*\)",
+        "literal": "for",
+        "suggestion": "Cache array length outside the loop to save gas",
+        "example": "uint256 length = array.length;\nfor (uint256 i = 0; i < length; i++) { ... }"
+    },
+    {
+        "pattern": r"public\s+(\w+)\s*\(",
+        "literal": "public",
+        "suggestion": "Use 'external' instead of 'public' for functions not called internally",
+        "example": "function exampleFunction() external { ... }"
+    },
+    {
+        "pattern": r"uint256",
+        "literal": "uint256",
+        "suggestion": "Use smaller integer types when possible (uint128, uint64, etc.)",
+        "example": "uint128 smallerInt = 100;"
+    },
+    {
+        "pattern": r"string\s+public",
+        "literal": "string",
+        "suggestion": "Use private strings with getters instead of public strings",
+        "example": "string private _name;\nfunction name() external view returns (string memory) { return _name; }"
+    },
+    {
+        "pattern": r"\+\+\s*\w+",
+        "literal": "++",
+        "suggestion": "Use ++i instead of i++ to save gas",
+        "example": "for (uint256 i = 0; i < length; ++i) { ... }"
+    }
+]
+
+# Suggestion patterns fused into one scan; each alternative is a lookahead so
+# patterns that overlap (e.g. "uint256" inside a loop header) are all found
+_SUGGESTION_RE = re.compile("|".join(
+    f"(?=(?P<suggestion_{i}>{info['pattern']}))" for i, info in enumerate(_SUGGESTION_PATTERNS)
+).encode())
+
+_SUGGESTION_LITERALS = tuple(info["literal"].encode() for info in _SUGGESTION_PATTERNS)
+
+def _contains_any(text: bytes, literals: Tuple[bytes, ...], start: int, end: int) -> bool:
+    """Pre-filter: whether any of the literals occurs in text[start:end]"""
+    return any(text.find(literal, start, end) != -1 for literal in literals)
+
+def _scan_function_bodies(regex, literals: Tuple[bytes, ...], functions: List[Dict[str, Any]]):
+    """
+    Scan all function bodies with one finditer over the shared source
+    
+    Yields (function index, match) for matches inside a body. None of the
+    scanned patterns can match a brace, so no match crosses a body boundary
+    and the results equal scanning each body on its own.
+    """
+    if not functions:
+        return
+    
+    source = functions[0]["source"]
+    start = functions[0]["body_start"]
+    end = functions[-1]["body_end"]
+    if not _contains_any(source, literals, start, end):
+        return
+    
+    # Functions are extracted in source order, so matches and bodies can be
+    # walked together
+    starts = [function["body_start"] for function in functions]
+    ends = [function["body_end"] for function in functions]
+    i = 0
+    for match in regex.finditer(source, start, end):
+        pos = match.start()
+        while pos >= ends[i]:
+            i += 1
+        if pos >= starts[i]:
+            yield i, match
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _savings_kernel(gas_saved, tx_volume, gas_price, eth_price):
+        # Same arithmetic as estimate_savings, element by element
+        eth_saved_per_tx = np.empty(gas_saved.shape[0])
+        total_eth_saved = np.empty(gas_saved.shape[0])
+        usd_saved = np.empty(gas_saved.shape[0])
+        for i in prange(gas_saved.shape[0]):
+            eth_saved_per_tx[i] = (gas_saved[i] * gas_price) / 1e9
+            total_eth_saved[i] = eth_saved_per_tx[i] * tx_volume
+            usd_saved[i] = total_eth_saved[i] * eth_price
+        return eth_saved_per_tx, total_eth_saved, usd_saved
+else:
+    def _savings_kernel(gas_saved, tx_volume, gas_price, eth_price):
+        eth_saved_per_tx = (gas_saved * gas_price) / 1e9
+        total_eth_saved = eth_saved_per_tx * tx_volume
+        return eth_saved_per_tx, total_eth_saved, total_eth_saved * eth_price
+
+# Optimization rewrite rule: compiled regex, replacement, description, gas saved per match
+OptimizationPattern = collections.namedtuple("OptimizationPattern", "regex repl desc gas")
+
+# Regexes shared by several optimization levels
+_ZERO_INIT_REGEX = re.compile(rb"uint256\s+(\w+)\s*=\s*0\s*;")
+_LENGTH_LOOP_REGEX = re.compile(rb"for\s*\(\s*uint256\s+i\s*=\s*0\s*;\s*i\s*<\s*(\w+)\.length\s*;\s*i\s*\+\+\s*\)")
+_PUBLIC_FUNCTION_REGEX = re.compile(rb"public\s+(\w+)\s*\(")
+
+# Optimization patterns for each optimization level, compiled once at import
+_OPTIMIZATION_PATTERNS: Dict[str, Tuple[OptimizationPattern, ...]] = {
+    # Minimal mode leaves the code unchanged
+    "minimal": (),
+    "balanced": (
+        OptimizationPattern(
+            _ZERO_INIT_REGEX,
+            rb"uint128 \1 = 0;",
+            "Reduced integer size where appropriate",
+            10000
+        ),
+        OptimizationPattern(
+            _LENGTH_LOOP_REGEX,
+            rb"uint256 _length = \1.length;\nfor (uint256 i = 0; i < _length; i++)",
+            "Cached array length in loops to save gas",
+            5000
+        ),
+        OptimizationPattern(
+            _PUBLIC_FUNCTION_REGEX,
+            rb"external \1(",
+            "Changed public to external for functions not called internally",
+            15000
+        )
+    ),
+    "aggressive": (
+        OptimizationPattern(
+            _ZERO_INIT_REGEX,
+            rb"uint128 \1 = 0;",
+            "Reduced integer size where appropriate",
+            10000
+        ),
+        OptimizationPattern(
+            _LENGTH_LOOP_REGEX,
+            rb"uint256 _length = \1.length;\nfor (uint256 i = 0; i < _length;) {\n// Loop body\nunsafe { unchecked { ++i; } }\n}",
+            "Optimized loops with cached length and unchecked increments",
+            15000
+        ),
+        OptimizationPattern(
+            _PUBLIC_FUNCTION_REGEX,
+            rb"external \1(",
+            "Changed public to external for functions not called internally",
+            15000
+        ),
+        OptimizationPattern(
+            re.compile(rb"function\s+(\w+)\s*\(\s*(.*?)\s*\)\s*public\s+view\s+returns\s*\(\s*(.*?)\s*\)"),
+            rb"function \1(\2) external view returns (\3)",
+            "Changed public view functions to external",
+            10000
+        ),
+        OptimizationPattern(
+            re.compile(rb"string\s+public"),
+            rb"string private",
+            "Changed public strings to private with getters",
+            20000
+        )
+    )
+}
+
 class GasOptimizer:
     """
     Gas Optimization Engine for Kontour Coin
@@ -19,79 +258,25 @@ class GasOptimizer:
     
     def __init__(self):
         """Initialize the gas optimization engine"""
-        self.optimization_patterns = self._load_optimization_patterns()
+        self.optimization_patterns = _OPTIMIZATION_PATTERNS
         
-    def _load_optimization_patterns(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Load optimization patterns for different optimization levels"""
+        # Bounded result caches keyed on the contract source, since the same
+        # contract is often analyzed repeatedly
+        self._analysis_cache = functools.lru_cache(maxsize=_RESULT_CACHE_SIZE)(self._analyze_contract)
+        self._optimization_cache = functools.lru_cache(maxsize=_RESULT_CACHE_SIZE)(self._optimize_contract)
+    
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss statistics for the analysis and optimization caches"""
         return {
-            "minimal": [
-                {
-                    "pattern": r"uint256\s+(\w+)\s*=\s*0\s*;",
-                    "replacement": r"uint256 \1 = 0;",
-                    "description": "No change in minimal mode",
-                    "gas_saved": 0
-                },
-                {
-                    "pattern": r"for\s*\(\s*uint256\s+i\s*=\s*0\s*;\s*i\s*<\s*(\w+)\.length\s*;\s*i\s*\+\+\s*\)",
-                    "replacement": r"for (uint256 i = 0; i < \1.length; i++)",
-                    "description": "No change to loops in minimal mode",
-                    "gas_saved": 0
-                }
-            ],
-            "balanced": [
-                {
-                    "pattern": r"uint256\s+(\w+)\s*=\s*0\s*;",
-                    "replacement": r"uint128 \1 = 0;",
-                    "description": "Reduced integer size where appropriate",
-                    "gas_saved": 10000
-                },
-                {
-                    "pattern": r"for\s*\(\s*uint256\s+i\s*=\s*0\s*;\s*i\s*<\s*(\w+)\.length\s*;\s*i\s*\+\+\s*\)",
-                    "replacement": r"uint256 _length = \1.length;\nfor (uint256 i = 0; i < _length; i++)",
-                    "description": "Cached array length in loops to save gas",
-                    "gas_saved": 5000
-                },
-                {
-                    "pattern": r"public\s+(\w+)\s*\(",
-                    "replacement": r"external \1(",
-                    "description": "Changed public to external for functions not called internally",
-                    "gas_saved": 15000
-                }
-            ],
-            "aggressive": [
-                {
-                    "pattern": r"uint256\s+(\w+)\s*=\s*0\s*;",
-                    "replacement": r"uint128 \1 = 0;",
-                    "description": "Reduced integer size where appropriate",
-                    "gas_saved": 10000
-                },
-                {
-                    "pattern": r"for\s*\(\s*uint256\s+i\s*=\s*0\s*;\s*i\s*<\s*(\w+)\.length\s*;\s*i\s*\+\+\s*\)",
-                    "replacement": r"uint256 _length = \1.length;\nfor (uint256 i = 0; i < _length;) {\n// Loop body\nunsafe { unchecked { ++i; } }\n}",
-                    "description": "Optimized loops with cached length and unchecked increments",
-                    "gas_saved": 15000
-                },
-                {
-                    "pattern": r"public\s+(\w+)\s*\(",
-                    "replacement": r"external \1(",
-                    "description": "Changed public to external for functions not called internally",
-                    "gas_saved": 15000
-                },
-                {
-                    "pattern": r"function\s+(\w+)\s*\(\s*(.*?)\s*\)\s*public\s+view\s+returns\s*\(\s*(.*?)\s*\)",
-                    "replacement": r"function \1(\2) external view returns (\3)",
-                    "description": "Changed public view functions to external",
-                    "gas_saved": 10000
-                },
-                {
-                    "pattern": r"string\s+public",
-                    "replacement": r"string private",
-                    "description": "Changed public strings to private with getters",
-                    "gas_saved": 20000
-                }
-            ]
+            "analysis": self._analysis_cache.cache_info()._asdict(),
+            "optimization": self._optimization_cache.cache_info()._asdict()
         }
     
+    def cache_clear(self):
+        """Drop all cached analysis and optimization results"""
+        self._analysis_cache.cache_clear()
+        self._optimization_cache.cache_clear()
+    
     def analyze_contract(self, contract_code: str) -> Dict[str, Any]:
         """
         Analyze a smart contract for gas usage
@@ -102,105 +287,205 @@ class GasOptimizer:
         Returns:
             Analysis results
         """
-        try:
-            # Extract functions from contract
-            functions = self._extract_functions(contract_code)
-            
-            # Calculate gas usage for each function
-            gas_usage = self._calculate_gas_usage(functions)
-            
-            # Generate optimization suggestions
-            suggestions = self._generate_suggestions(functions)
-            
-            return {
-                "gas_usage": gas_usage,
-                "suggestions": suggestions,
-                "function_count": len(functions),
-                "contract_size": len(contract_code)
-            }
-        except Exception as e:
-            logger.error(f"Error analyzing contract: {e}")
-            raise ValueError(f"Error analyzing contract: {e}")
+        # Copy so callers cannot modify the cached result
+        return copy.deepcopy(self._analysis_cache(contract_code))
     
-    def optimize_contract(self, contract_code: str, optimization_level: str = "balanced") -> Dict[str, Any]:
+    def _analyze_contract(self, contract_code: str) -> Dict[str, Any]:
+        """Analyze a smart contract, bypassing the result cache"""
+        # Blank code has no functions to scan
+        if not contract_code.strip():
+            return self._empty_analysis(contract_code)
+        
+        return self._analyze_source(contract_code.encode(_SOURCE_ENCODING, _SOURCE_ERRORS), len(contract_code))
+    
+    def _analyze_source(self, source: bytes, contract_size: int) -> Dict[str, Any]:
+        """Analyze encoded contract source; contract_size is its length in characters"""
+        # Extract functions from contract
+        functions = self._extract_functions(source)
+        
+        # Calculate gas usage for each function
+        gas_usage = self._calculate_gas_usage(functions)
+        
+        # Generate optimization suggestions
+        suggestions = self._generate_suggestions(functions)
+        
+        return {
+            "gas_usage": gas_usage,
+            "suggestions": suggestions,
+            "function_count": len(functions),
+            "contract_size": contract_size
+        }
+    
+    def optimize_contract(self, contract_code: str, optimization_level: str = "balanced", reanalyze: bool = True) -> Dict[str, Any]:
         """
         Optimize a smart contract for gas usage
         
         Args:
             contract_code: Solidity contract code
             optimization_level: Optimization level (minimal, balanced, aggressive)
+            reanalyze: Analyze all of the optimized code; if False, only the
+                function bodies the rewrites changed are analyzed again and
+                the rest of the original analysis is reused
             
         Returns:
             Optimization results
         """
-        try:
-            # Validate optimization level
-            if optimization_level not in ["minimal", "balanced", "aggressive"]:
-                optimization_level = "balanced"
-            
-            # Get optimization patterns for the selected level
-            patterns = self.optimization_patterns.get(optimization_level, [])
-            
-            # Apply optimizations
-            optimized_code = contract_code
-            applied_optimizations = []
-            total_gas_saved = 0
-            
-            for pattern in patterns:
-                # Count matches before optimization
-                matches_before = len(re.findall(pattern["pattern"], optimized_code))
-                
-                if matches_before > 0:
-                    # Apply optimization
-                    optimized_code = re.sub(pattern["pattern"], pattern["replacement"], optimized_code)
-                    
-                    # Count matches after optimization
-                    matches_after = len(re.findall(pattern["pattern"], optimized_code))
-                    
-                    # Calculate gas saved
-                    optimizations_applied = matches_before - matches_after
-                    gas_saved = optimizations_applied * pattern["gas_saved"]
-                    total_gas_saved += gas_saved
-                    
-                    # Record applied optimization
-                    if optimizations_applied > 0:
-                        applied_optimizations.append({
-                            "description": pattern["description"],
-                            "count": optimizations_applied,
-                            "gas_saved": gas_saved
-                        })
-            
-            # Analyze original and optimized contracts
-            original_analysis = self.analyze_contract(contract_code)
-            optimized_analysis = self.analyze_contract(optimized_code)
-            
+        # Validate optimization level
+        if optimization_level not in ["minimal", "balanced", "aggressive"]:
+            optimization_level = "balanced"
+        
+        # Copy so callers cannot modify the cached result
+        return copy.deepcopy(self._optimization_cache(contract_code, optimization_level, reanalyze))
+    
+    def _optimize_contract(self, contract_code: str, optimization_level: str, reanalyze: bool) -> Dict[str, Any]:
+        """Optimize a smart contract at a validated level, bypassing the result cache"""
+        # Blank code has nothing to rewrite or analyze
+        if not contract_code.strip():
+            empty_analysis = self._empty_analysis(contract_code)
             return {
                 "original_code": contract_code,
-                "optimized_code": optimized_code,
+                "optimized_code": contract_code,
                 "optimization_level": optimization_level,
-                "applied_optimizations": applied_optimizations,
-                "total_gas_saved": total_gas_saved,
+                "applied_optimizations": [],
+                "total_gas_saved": 0,
+                "original_analysis": empty_analysis,
+                "optimized_analysis": empty_analysis
+            }
+        
+        # Minimal mode applies no rewrites, so only the original needs analyzing
+        if optimization_level == "minimal":
+            original_analysis = self._analysis_cache(contract_code)
+            return {
+                "original_code": contract_code,
+                "optimized_code": contract_code,
+                "optimization_level": optimization_level,
+                "applied_optimizations": [],
+                "total_gas_saved": 0,
                 "original_analysis": original_analysis,
-                "optimized_analysis": optimized_analysis
+                "optimized_analysis": original_analysis
             }
-        except Exception as e:
-            logger.error(f"Error optimizing contract: {e}")
-            raise ValueError(f"Error optimizing contract: {e}")
+        
+        # Get optimization patterns for the selected level
+        patterns = self.optimization_patterns.get(optimization_level, ())
+        
+        # Apply optimizations to the encoded source
+        source = contract_code.encode(_SOURCE_ENCODING, _SOURCE_ERRORS)
+        optimized_source = source
+        applied_optimizations = []
+        total_gas_saved = 0
+        
+        for regex, repl, desc, gas in patterns:
+            # Apply optimization and count replacements in one pass
+            optimized_source, optimizations_applied = regex.subn(repl, optimized_source)
+            
+            # Calculate gas saved
+            gas_saved = optimizations_applied * gas
+            total_gas_saved += gas_saved
+            
+            # Record applied optimization
+            if optimizations_applied > 0:
+                applied_optimizations.append({
+                    "description": desc,
+                    "count": optimizations_applied,
+                    "gas_saved": gas_saved
+                })
+        
+        # Analyze the original contract; when no pattern changed the code,
+        # that analysis already covers the optimized contract too
+        original_analysis = self._analysis_cache(contract_code)
+        if optimized_source == source:
+            optimized_code = contract_code
+            optimized_analysis = original_analysis
+        elif reanalyze:
+            optimized_code = optimized_source.decode(_SOURCE_ENCODING, _SOURCE_ERRORS)
+            optimized_analysis = self._analyze_source(optimized_source, len(optimized_code))
+        else:
+            optimized_code = optimized_source.decode(_SOURCE_ENCODING, _SOURCE_ERRORS)
+            optimized_analysis = self._derive_analysis(original_analysis, source, optimized_source, len(optimized_code))
+        
+        return {
+            "original_code": contract_code,
+            "optimized_code": optimized_code,
+            "optimization_level": optimization_level,
+            "applied_optimizations": applied_optimizations,
+            "total_gas_saved": total_gas_saved,
+            "original_analysis": original_analysis,
+            "optimized_analysis": optimized_analysis
+        }
     
-    def _extract_functions(self, contract_code: str) -> List[Dict[str, Any]]:
-        """Extract functions from contract code"""
-        functions = []
+    def _derive_analysis(self, original_analysis: Dict[str, Any], source: bytes, optimized_source: bytes, contract_size: int) -> Dict[str, Any]:
+        """
+        Analyze optimized source by reusing the original analysis for every
+        function whose body the rewrites left unchanged
+        
+        Gas usage and suggestions depend only on function bodies, so the
+        result equals a full analysis of the optimized source. Rewrites
+        outside function bodies, such as state variables and headers, need
+        no scan at all.
+        """
+        original_functions = self._extract_functions(source)
+        functions = self._extract_functions(optimized_source)
+        
+        # Results are keyed by function name, so they can only be carried
+        # over when the same uniquely named functions are found in order
+        names = [function["name"] for function in functions]
+        if names != [function["name"] for function in original_functions] or len(set(names)) != len(names):
+            return self._analyze_source(optimized_source, contract_size)
+        
+        changed = [
+            function for function, original in zip(functions, original_functions)
+            if optimized_source[function["body_start"]:function["body_end"]] != source[original["body_start"]:original["body_end"]]
+        ]
+        changed_names = {function["name"] for function in changed}
+        
+        by_function = dict(original_analysis["gas_usage"]["by_function"])
+        by_function.update(self._calculate_gas_usage(changed)["by_function"])
+        
+        suggestions = {
+            entry["function"]: entry
+            for entry in original_analysis["suggestions"]
+            if entry["function"] not in changed_names
+        }
+        suggestions.update((entry["function"], entry) for entry in self._generate_suggestions(changed))
         
-        # Regular expression to match function declarations and bodies
-        function_regex = r"function\s+(\w+)\s*\(([^)]*)\)\s*(public|private|internal|external)?\s*(view|pure|payable)?\s*(?:returns\s*\(([^)]*)\))?\s*{([^}]*)}"
+        return {
+            "gas_usage": {
+                "total": sum(by_function.values()),
+                "by_function": by_function
+            },
+            "suggestions": [suggestions[name] for name in names if name in suggestions],
+            "function_count": len(functions),
+            "contract_size": contract_size
+        }
+    
+    def _empty_analysis(self, contract_code: str) -> Dict[str, Any]:
+        """Analysis result for code without any functions"""
+        return {
+            "gas_usage": {
+                "total": 0,
+                "by_function": {}
+            },
+            "suggestions": [],
+            "function_count": 0,
+            "contract_size": len(contract_code)
+        }
+    
+    def _extract_functions(self, source: bytes) -> List[Dict[str, Any]]:
+        """Extract functions from encoded contract source"""
+        functions = []
         
-        for match in re.finditer(function_regex, contract_code):
-            function_name = match.group(1)
-            parameters = match.group(2)
-            visibility = match.group(3) or "public"
-            mutability = match.group(4) or ""
-            returns = match.group(5) or ""
-            body = match.group(6)
+        pos = 0
+        while True:
+            match = _FUNCTION_HEADER_REGEX.search(source, pos)
+            if match is None:
+                break
+            
+            function_name, parameters, visibility, mutability, returns = (
+                (group or b"").decode(_SOURCE_ENCODING, _SOURCE_ERRORS) for group in match.groups()
+            )
+            visibility = visibility or "public"
+            body_end = self._find_body_end(source, match.end())
+            pos = body_end + 1
             
             functions.append({
                 "name": function_name,
@@ -208,12 +493,29 @@ class GasOptimizer:
                 "visibility": visibility,
                 "mutability": mutability,
                 "returns": returns,
-                "body": body,
-                "full_match": match.group(0)
+                # Offsets into the shared source instead of copied substrings
+                "source": source,
+                "start": match.start(),
+                "body_start": match.end(),
+                "body_end": body_end
             })
         
         return functions
     
+    def _find_body_end(self, source: bytes, start: int) -> int:
+        """Return the index of the brace closing a body that opens just before start"""
+        depth = 1
+        for token in _BRACE_TOKEN_REGEX.finditer(source, start):
+            if token.group() == b"{":
+                depth += 1
+            elif token.group() == b"}":
+                depth -= 1
+                if depth == 0:
+                    return token.start()
+        
+        # Unterminated body runs to the end of the code
+        return len(source)
+    
     def _calculate_gas_usage(self, functions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate gas usage for each function"""
         gas_usage = {
@@ -221,50 +523,21 @@ class GasOptimizer:
             "by_function": {}
         }
         
-        # Gas cost patterns
-        gas_cost_patterns = {
-            "storage_write": {
-                "pattern": r"\w+\s*=\s*",
-                "cost": 5000
-            },
-            "storage_read": {
-                "pattern": r"\w+\[\w+\]",
-                "cost": 800
-            },
-            "external_call": {
-                "pattern": r"\.\w+\(",
-                "cost": 2500
-            },
-            "event_emit": {
-                "pattern": r"emit\s+\w+",
-                "cost": 1500
-            },
-            "require": {
-                "pattern": r"require\(",
-                "cost": 200
-            },
-            "loop": {
-                "pattern": r"for\s*\(",
-                "cost": 300
-            }
-        }
+        # (function index, pattern id) for every gas cost match
+        hits = np.array([
+            (i, match.lastindex - 1)
+            for i, match in _scan_function_bodies(_GAS_COST_RE, _GAS_COST_LITERALS, functions)
+        ], dtype=np.int64).reshape(-1, 2)
         
-        for function in functions:
-            function_name = function["name"]
-            body = function["body"]
-            
-            # Base gas cost for function call
-            function_gas = 21000
-            
-            # Add gas cost for patterns
-            for pattern_name, pattern_info in gas_cost_patterns.items():
-                matches = len(re.findall(pattern_info["pattern"], body))
-                pattern_gas = matches * pattern_info["cost"]
-                function_gas += pattern_gas
-            
-            # Store function gas usage
-            gas_usage["by_function"][function_name] = function_gas
-            gas_usage["total"] += function_gas
+        # Base gas cost for function call, plus the pattern costs summed per function
+        pattern_gas = np.bincount(hits[:, 0], weights=_GAS_COSTS_ARR[hits[:, 1]], minlength=len(functions))
+        function_gas = (21000 + pattern_gas.astype(np.int64)).tolist()
+        
+        for function, gas in zip(functions, function_gas):
+            # Store function gas usage; overloads share a name, so their gas
+            # is summed to keep the total equal to the per-function sum
+            gas_usage["by_function"][function["name"]] = gas_usage["by_function"].get(function["name"], 0) + gas
+            gas_usage["total"] += gas
         
         return gas_usage
     
@@ -272,51 +545,27 @@ class GasOptimizer:
         """Generate optimization suggestions for functions"""
         suggestions = []
         
-        # Suggestion patterns
-        suggestion_patterns = [
-            {
-                "pattern": r"for\s*\(\s*\w+\s+\w+\s*=\s*0\s*;\s*\w+\s*<\s*(\w+)\.length\s*;\s*\w+\s*\+\+\s*\)",
-                "suggestion": "Cache array length outside the loop to save gas",
-                "example": "uint256 length = array.length;\nfor (uint256 i = 0; i < length; i++) { ... }"
-            },
-            {
-                "pattern": r"public\s+(\w+)\s*\(",
-                "suggestion": "Use 'external' instead of 'public' for functions not called internally",
-                "example": "function exampleFunction() external { ... }"
-            },
-            {
-                "pattern": r"uint256",
-                "suggestion": "Use smaller integer types when possible (uint128, uint64, etc.)",
-                "example": "uint128 smallerInt = 100;"
-            },
-            {
-                "pattern": r"string\s+public",
-                "suggestion": "Use private strings with getters instead of public strings",
-                "example": "string private _name;\nfunction name() external view returns (string memory) { return _name; }"
-            },
-            {
-                "pattern": r"\+\+\s*\w+",
-                "suggestion": "Use ++i instead of i++ to save gas",
-                "example": "for (uint256 i = 0; i < length; ++i) { ... }"
-            }
-        ]
+        # Collect the patterns present in each body in a single scan
+        found = [set() for _ in functions]
+        for i, match in _scan_function_bodies(_SUGGESTION_RE, _SUGGESTION_LITERALS, functions):
+            found[i].add(match.lastgroup)
         
-        for function in functions:
-            function_name = function["name"]
-            body = function["body"]
-            
-            function_suggestions = []
+        for function, function_found in zip(functions, found):
+            if not function_found:
+                continue
             
-            for pattern_info in suggestion_patterns:
-                if re.search(pattern_info["pattern"], body):
-                    function_suggestions.append({
-                        "suggestion": pattern_info["suggestion"],
-                        "example": pattern_info["example"]
-                    })
+            function_suggestions = [
+                {
+                    "suggestion": pattern_info["suggestion"],
+                    "example": pattern_info["example"]
+                }
+                for i, pattern_info in enumerate(_SUGGESTION_PATTERNS)
+                if f"suggestion_{i}" in function_found
+            ]
             
             if function_suggestions:
                 suggestions.append({
-                    "function": function_name,
+                    "function": function["name"],
                     "suggestions": function_suggestions
                 })
         
@@ -353,6 +602,32 @@ class GasOptimizer:
             "gas_price": gas_price,
             "eth_price": eth_price
         }
+    
+    def estimate_savings_batch(self, gas_saved: np.ndarray, tx_volume: int = 100, gas_price: int = 50, eth_price: float = 3000) -> Dict[str, Any]:
+        """
+        Estimate savings for many gas savings amounts at once
+        
+        Args:
+            gas_saved: Array of gas saved amounts
+            tx_volume: Estimated transaction volume
+            gas_price: Gas price in Gwei
+            eth_price: ETH price in USD
+            
+        Returns:
+            Estimated savings, with one array entry per gas saved amount
+        """
+        gas_saved = np.ascontiguousarray(gas_saved, dtype=np.int64)
+        eth_saved_per_tx, total_eth_saved, usd_saved = _savings_kernel(gas_saved, tx_volume, gas_price, eth_price)
+        
+        return {
+            "gas_saved": gas_saved,
+            "eth_saved_per_tx": eth_saved_per_tx,
+            "total_eth_saved": total_eth_saved,
+            "usd_saved": usd_saved,
+            "tx_volume": tx_volume,
+            "gas_price": gas_price,
+            "eth_price": eth_price
+        }
 
 # Create global gas optimizer instance
 gas_optimizer = GasOptimizer()
\ No newline at end of file
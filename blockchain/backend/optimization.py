@@ -4,25 +4,299 @@ Deep learning and optimization algorithms for blockchain performance
 """
 
 import numpy as np
-import tensorflow as tf
-from tensorflow import keras
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
 import json
 import logging
 import time
 import os
-import pickle
+import struct
+import hashlib
+import threading
+import functools
+import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+if TYPE_CHECKING:
+    from tensorflow import keras
+
+# Optional JIT compilation for the MLP forward pass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger("kontourcoin-optimization")
 
-# Model cache
-MODEL_CACHE = {}
+# TensorFlow module, imported on first use since importing it is slow
+_tf_module = None
+
+def _tf():
+    """Import and configure TensorFlow on first use"""
+    global _tf_module
+    if _tf_module is None:
+        # oneDNN provides the fused MatMul+BiasAdd+Relu CPU kernels; it is read
+        # at import, so set TF_ENABLE_ONEDNN_OPTS=0 beforehand to opt out
+        os.environ.setdefault("TF_ENABLE_ONEDNN_OPTS", "1")
+        import tensorflow
+        
+        # Let XLA cluster and fuse ops in graphs not compiled explicitly
+        tensorflow.config.optimizer.set_jit(True)
+        
+        # Grappler's remapper rewrites each Dense layer's MatMul, BiasAdd and
+        # activation into one fused op in traced graphs
+        tensorflow.config.optimizer.set_experimental_options({
+            "remapping": True,
+            "layout_optimizer": True,
+            "auto_mixed_precision": False
+        })
+        _tf_module = tensorflow
+    return _tf_module
+
+# Model storage
 MODEL_DIR = os.path.join(os.path.dirname(__file__), "models")
 
 # Create model directory if it doesn't exist
 os.makedirs(MODEL_DIR, exist_ok=True)
 
+# Model types converted with int8 instead of float16 weights
+INT8_MODEL_TYPES = {"network"}
+
+# Number of calibration samples fed to the int8 converter
+REPRESENTATIVE_SAMPLES = 100
+
+# TFLite interpreter threads; requests are a handful of rows, for which
+# thread pool wakeups cost more than the matrix products
+INFERENCE_THREADS = int(os.environ.get("KONTOUR_INFERENCE_THREADS", "1"))
+
+# Full-batch gradient steps used to fit the demo models; the ten-sample demo
+# sets fit in one batch, so this matches the former 100 epochs of fit()
+DEMO_TRAINING_STEPS = 100
+
+# Number of optimize_* results cached per model type, and the decimals float
+# parameters are rounded to for the cache key (float32 inputs resolve little more)
+RESULT_CACHE_SIZE = 4096
+CACHE_DECIMALS = 6
+
+# Input features of each model type, in model input order
+MODEL_FEATURES = {
+    "transaction": ("txCount", "blockSize", "networkLoad", "fee"),
+    "contour": ("dimensions", "points", "complexity", "curvature", "length", "iterations"),
+    "network": ("nodeCount", "connections", "avgLatency", "txPoolSize",
+                "blockSize", "hashRate", "difficulty", "propagationTime")
+}
+
+# Flat weight file shared by all model types: magic, model count, then per model
+# its name and layers (in/out dims, activation code, float32 kernel and bias).
+# Every field is a multiple of 4 bytes so the arrays map as aligned views.
+WEIGHTS_FILE = "weights.bin"
+
+# Manifest of saved model files, and the formats load_models tries per type,
+# lightest first
+MANIFEST_FILE = "manifest.json"
+MODEL_FORMATS = ("weights", "tflite", "savedmodel")
+WEIGHTS_MAGIC = b"KCW1"
+ACTIVATIONS = ("linear", "relu", "sigmoid")
+
+class TransactionResult(collections.namedtuple("TransactionResult", (
+        "tx_count block_size network_load fee processing_time "
+        "optimized_block_size optimized_fee estimated_processing_time"))):
+    """Transaction optimization result; fields are arrays for batched results"""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Nested dict of original and optimized values, as formerly returned"""
+        return {
+            "original": {
+                "txCount": self.tx_count,
+                "blockSize": self.block_size,
+                "networkLoad": self.network_load,
+                "fee": self.fee,
+                "processingTime": self.processing_time
+            },
+            "optimized": {
+                "blockSize": self.optimized_block_size,
+                "fee": self.optimized_fee,
+                "estimatedProcessingTime": self.estimated_processing_time
+            }
+        }
+
+class ContourResult(collections.namedtuple("ContourResult", (
+        "dimensions points complexity curvature length iterations processing_time "
+        "optimized_points optimized_curvature estimated_complexity estimated_processing_time"))):
+    """Contour optimization result; fields are arrays for batched results"""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Nested dict of original and optimized values, as formerly returned"""
+        return {
+            "original": {
+                "dimensions": self.dimensions,
+                "points": self.points,
+                "complexity": self.complexity,
+                "curvature": self.curvature,
+                "length": self.length,
+                "iterations": self.iterations,
+                "processingTime": self.processing_time
+            },
+            "optimized": {
+                "points": self.optimized_points,
+                "curvature": self.optimized_curvature,
+                "estimatedComplexity": self.estimated_complexity,
+                "estimatedProcessingTime": self.estimated_processing_time
+            }
+        }
+
+class NetworkResult(collections.namedtuple("NetworkResult", (
+        "node_count connections avg_latency tx_pool_size block_size hash_rate "
+        "difficulty propagation_time throughput efficiency reliability "
+        "optimized_connections optimized_latency optimized_propagation_time "
+        "estimated_throughput estimated_efficiency estimated_reliability"))):
+    """Network optimization result; fields are arrays for batched results"""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Nested dict of original and optimized values, as formerly returned"""
+        return {
+            "original": {
+                "nodeCount": self.node_count,
+                "connections": self.connections,
+                "avgLatency": self.avg_latency,
+                "txPoolSize": self.tx_pool_size,
+                "blockSize": self.block_size,
+                "hashRate": self.hash_rate,
+                "difficulty": self.difficulty,
+                "propagationTime": self.propagation_time,
+                "throughput": self.throughput,
+                "efficiency": self.efficiency,
+                "reliability": self.reliability
+            },
+            "optimized": {
+                "connections": self.optimized_connections,
+                "avgLatency": self.optimized_latency,
+                "propagationTime": self.optimized_propagation_time,
+                "estimatedThroughput": self.estimated_throughput,
+                "estimatedEfficiency": self.estimated_efficiency,
+                "estimatedReliability": self.estimated_reliability
+            }
+        }
+
+def _quantize(values: List[Any]) -> Tuple[Any, ...]:
+    """Round float parameters so near-identical requests share a cache entry"""
+    return tuple(round(value, CACHE_DECIMALS) if isinstance(value, float) else value for value in values)
+
+def _result_row(batch: Tuple[np.ndarray, ...], values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Convert a one-row batched result to Python scalars, keeping the inputs as given"""
+    return type(batch)(*values, *(field[0].item() for field in batch[len(values):]))
+
+def _model_files(path: str) -> List[str]:
+    """Files making up a saved model: the file itself, or all files of a directory"""
+    if not os.path.isdir(path):
+        return [path]
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+def _stat_fingerprint(path: str) -> Dict[str, int]:
+    """Total size and latest modification time of a saved model"""
+    stats = [os.stat(name) for name in _model_files(path)]
+    return {
+        "size": sum(stat.st_size for stat in stats),
+        "mtime_ns": max((stat.st_mtime_ns for stat in stats), default=0)
+    }
+
+def _sha256(path: str) -> str:
+    """SHA-256 over the relative names and contents of a saved model's files"""
+    digest = hashlib.sha256()
+    for name in _model_files(path):
+        digest.update(os.path.relpath(name, path).encode())
+        with open(name, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_weights(path: str, models: Dict[str, List[Tuple[np.ndarray, np.ndarray, str]]]) -> None:
+    """Write the dense layers of several models to one flat weight file"""
+    # Write aside and swap in, so arrays still mapped from the old file stay valid
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(WEIGHTS_MAGIC)
+        f.write(struct.pack("<I", len(models)))
+        for model_type, layers in models.items():
+            name = model_type.encode()
+            f.write(struct.pack("<I", len(name)))
+            f.write(name + b"\0" * (-len(name) % 4))
+            f.write(struct.pack("<I", len(layers)))
+            for kernel, bias, activation in layers:
+                f.write(struct.pack("<III", kernel.shape[0], kernel.shape[1], ACTIVATIONS.index(activation)))
+                f.write(np.ascontiguousarray(kernel, dtype="<f4").tobytes())
+                f.write(np.ascontiguousarray(bias, dtype="<f4").tobytes())
+    os.replace(tmp_path, path)
+
+def _read_weights(path: str) -> Dict[str, List[Tuple[np.ndarray, np.ndarray, str]]]:
+    """Map a flat weight file; kernels and biases are read-only views into it"""
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    if bytes(data[:4]) != WEIGHTS_MAGIC:
+        raise ValueError(f"Not a weight file: {path}")
+    offset = 4
+    
+    def take(count: int, dtype: str) -> np.ndarray:
+        nonlocal offset
+        size = count * np.dtype(dtype).itemsize
+        view = data[offset:offset + size].view(dtype)
+        offset += size
+        return view
+    
+    models = {}
+    for _ in range(int(take(1, "<u4")[0])):
+        name_len = int(take(1, "<u4")[0])
+        name = bytes(take(name_len + (-name_len % 4), "u1")[:name_len]).decode()
+        layers = []
+        for _ in range(int(take(1, "<u4")[0])):
+            n_in, n_out, activation = (int(v) for v in take(3, "<u4"))
+            kernel = take(n_in * n_out, "<f4").reshape(n_in, n_out)
+            bias = take(n_out, "<f4")
+            layers.append((kernel, bias, ACTIVATIONS[activation]))
+        models[name] = layers
+    return models
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _dense(x, kernel, bias, relu):
+        # Dense layer as plain loops; the layers are too small to gain from BLAS
+        out = np.empty((x.shape[0], kernel.shape[1]), dtype=np.float32)
+        for i in range(x.shape[0]):
+            for j in range(kernel.shape[1]):
+                acc = bias[j]
+                for k in range(kernel.shape[0]):
+                    acc += x[i, k] * kernel[k, j]
+                if relu and acc < 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = acc
+        return out
+    
+    @njit(cache=True, fastmath=True)
+    def _fwd_linear(x, w0, b0, w1, b1, w2, b2, w3, b3):
+        # Three ReLU layers and a linear head (transaction and contour models)
+        h = _dense(x, w0, b0, True)
+        h = _dense(h, w1, b1, True)
+        h = _dense(h, w2, b2, True)
+        return _dense(h, w3, b3, False)
+    
+    @njit(cache=True, fastmath=True)
+    def _fwd_sigmoid(x, w0, b0, w1, b1, w2, b2, w3, b3):
+        # Three ReLU layers and a sigmoid head (network model)
+        return 1.0 / (1.0 + np.exp(-_fwd_linear(x, w0, b0, w1, b1, w2, b2, w3, b3)))
+    
+    # JIT kernels by head activation, for models shaped like _create_model's
+    _FORWARD_KERNELS = {"linear": _fwd_linear, "sigmoid": _fwd_sigmoid}
+else:
+    _FORWARD_KERNELS = {}
+
 class OptimizationEngine:
     """
     Deep learning optimization engine for Kontour Coin
@@ -31,28 +305,379 @@ class OptimizationEngine:
     def __init__(self):
         """Initialize the optimization engine"""
         self.models = {}
+        self._predict_fns = {}
+        self._interpreters = {}
+        self._numpy_mlps = {}
+        self._scratch = threading.local()
+        
+        # Guards installing models, which load_models does from several threads
+        self._lock = threading.Lock()
+        
+        # Bounded caches of optimize_* results keyed on quantized parameters
+        self._transaction_cache = functools.lru_cache(maxsize=RESULT_CACHE_SIZE)(self._optimize_transaction_core)
+        self._contour_cache = functools.lru_cache(maxsize=RESULT_CACHE_SIZE)(self._optimize_contour_core)
+        self._network_cache = functools.lru_cache(maxsize=RESULT_CACHE_SIZE)(self._optimize_network_core)
+        
         self.load_models()
     
+    def cache_clear(self) -> None:
+        """Drop all cached optimization results"""
+        self._transaction_cache.cache_clear()
+        self._contour_cache.cache_clear()
+        self._network_cache.cache_clear()
+    
     def load_models(self) -> None:
-        """Load pre-trained models from disk"""
+        """Load the models listed in the manifest, preferring the lightest inference format"""
         try:
-            for model_type in ["transaction", "contour", "network"]:
-                model_path = os.path.join(MODEL_DIR, f"{model_type}_model")
-                if os.path.exists(model_path):
-                    self.models[model_type] = keras.models.load_model(model_path)
-                    logger.info(f"Loaded model: {model_type}")
+            entries = self._read_manifest()
+            model_types = [
+                model_type for model_type in MODEL_FEATURES
+                if any(entry["type"] == model_type for entry in entries)
+            ]
+            if not model_types:
+                return
+            
+            # Model types load independently, and file reads and TensorFlow's
+            # graph loading release the GIL
+            with ThreadPoolExecutor(max_workers=len(model_types)) as executor:
+                futures = {
+                    executor.submit(self._load_model_type, model_type, entries): model_type
+                    for model_type in model_types
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Error loading model {futures[future]}: {e}")
         except Exception as e:
             logger.error(f"Error loading models: {e}")
     
-    def save_model(self, model_type: str, model: keras.Model) -> None:
-        """Save model to disk"""
+    def _load_model_type(self, model_type: str, entries: List[Dict[str, Any]]) -> None:
+        """Load the lightest current format of one model type listed in the manifest"""
+        loaders = {
+            "weights": self._load_weights,
+            "tflite": self._load_tflite,
+            "savedmodel": self._load_savedmodel
+        }
+        candidates = sorted(
+            (entry for entry in entries if entry["type"] == model_type),
+            key=lambda entry: MODEL_FORMATS.index(entry["format"])
+        )
+        for entry in candidates:
+            path = os.path.join(MODEL_DIR, entry["path"])
+            if not self._is_current(path, entry):
+                logger.warning(f"Skipping stale {entry['format']} model: {model_type}")
+                continue
+            loaders[entry["format"]](model_type, path)
+            logger.info(f"Loaded {entry['format']} model: {model_type}")
+            return
+    
+    def _read_manifest(self) -> List[Dict[str, Any]]:
+        """Entries of the model manifest, empty when nothing was saved yet"""
+        try:
+            with open(os.path.join(MODEL_DIR, MANIFEST_FILE)) as f:
+                return json.load(f)["models"]
+        except FileNotFoundError:
+            return []
+    
+    def _update_manifest(self, model_type: str, model_format: str, path: str, n_params: int) -> None:
+        """Record a saved model file, refreshing every entry that shares it"""
+        rel_path = os.path.relpath(path, MODEL_DIR)
+        entries = [
+            entry for entry in self._read_manifest()
+            if (entry["type"], entry["format"]) != (model_type, model_format)
+        ]
+        entries.append({"type": model_type, "format": model_format, "path": rel_path, "n_params": n_params})
+        
+        # The weight file holds every model type, so rewriting it changes
+        # the fingerprint of each of their entries
+        fingerprint = {"sha256": _sha256(path), **_stat_fingerprint(path)}
+        for entry in entries:
+            if entry["path"] == rel_path:
+                entry.update(fingerprint)
+        
+        self._write_manifest(entries)
+    
+    def _drop_manifest_entry(self, model_type: str, model_format: str) -> None:
+        """Remove a saved model file from the manifest, so it is no longer loaded"""
+        entries = self._read_manifest()
+        kept = [entry for entry in entries if (entry["type"], entry["format"]) != (model_type, model_format)]
+        if len(kept) != len(entries):
+            self._write_manifest(kept)
+    
+    def _write_manifest(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the manifest atomically"""
+        manifest_path = os.path.join(MODEL_DIR, MANIFEST_FILE)
+        with open(manifest_path + ".tmp", "w") as f:
+            json.dump({"models": entries}, f, indent=2)
+        os.replace(manifest_path + ".tmp", manifest_path)
+    
+    def _is_current(self, path: str, entry: Dict[str, Any]) -> bool:
+        """Whether a saved model file still matches its manifest entry"""
         try:
+            fingerprint = _stat_fingerprint(path)
+        except (OSError, ValueError):
+            return False
+        
+        # Size and mtime match unless the file was touched since it was
+        # recorded; only then is it hashed again
+        if all(entry.get(key) == value for key, value in fingerprint.items()):
+            return True
+        return _sha256(path) == entry.get("sha256")
+    
+    def _load_weights(self, model_type: str, path: str) -> None:
+        """Load one model's layers from the flat weight file"""
+        mlp = self._build_mlp(_read_weights(path)[model_type])
+        with self._lock:
+            self._numpy_mlps[model_type] = mlp
+            self.cache_clear()
+    
+    def _load_savedmodel(self, model_type: str, path: str) -> None:
+        """Load and register a Keras SavedModel"""
+        self._register_model(model_type, _tf().keras.models.load_model(path))
+    
+    def _load_tflite(self, model_type: str, model_path: str) -> None:
+        """Load a TFLite model and cache its interpreter and tensor indices"""
+        tf = _tf()
+        # The AUTO resolver applies the XNNPACK delegate's fused SIMD kernels
+        interpreter = tf.lite.Interpreter(
+            model_path=model_path,
+            num_threads=INFERENCE_THREADS,
+            experimental_op_resolver_type=tf.lite.experimental.OpResolverType.AUTO
+        )
+        interpreter.allocate_tensors()
+        input_details = interpreter.get_input_details()[0]
+        output_index = interpreter.get_output_details()[0]["index"]
+        entry = {
+            "interpreter": interpreter,
+            "input_index": input_details["index"],
+            "output_index": output_index,
+            "input_shape": tuple(input_details["shape"]),
+            # Returns a writable view of the input tensor; views must not be
+            # held across invoke(), so one is fetched per call
+            "input": interpreter.tensor(input_details["index"])
+        }
+        with self._lock:
+            self._interpreters[model_type] = entry
+            self.cache_clear()
+    
+    def _tflite_predict(self, model_type: str, inputs: np.ndarray) -> np.ndarray:
+        """Run inference with a cached TFLite interpreter"""
+        entry = self._interpreters[model_type]
+        interpreter = entry["interpreter"]
+        
+        # Tensors are only reallocated when the batch size changes
+        if entry["input_shape"] != inputs.shape:
+            interpreter.resize_tensor_input(entry["input_index"], inputs.shape)
+            interpreter.allocate_tensors()
+            entry["input_shape"] = inputs.shape
+        
+        # Write in place rather than through set_tensor's checked copy
+        entry["input"]()[...] = inputs
+        interpreter.invoke()
+        return interpreter.get_tensor(entry["output_index"])
+    
+    def _extract_layers(self, model: "keras.Model") -> Optional[List[Tuple[np.ndarray, np.ndarray, str]]]:
+        """
+        Extract (kernel, bias, activation) for each dense layer of a Keras model
+        
+        Returns None unless the model is a stack of Dense layers with
+        activations the NumPy forward pass and the weight file support.
+        """
+        dense = _tf().keras.layers.Dense
+        if not all(
+            isinstance(layer, dense) and layer.use_bias and layer.get_config()["activation"] in ACTIVATIONS
+            for layer in model.layers
+        ):
+            return None
+        
+        return [
+            (
+                np.ascontiguousarray(layer.kernel.numpy(), dtype=np.float32),
+                np.ascontiguousarray(layer.bias.numpy(), dtype=np.float32),
+                layer.get_config()["activation"]
+            )
+            for layer in model.layers
+        ]
+    
+    def _build_mlp(self, layers: List[Tuple[np.ndarray, np.ndarray, str]]) -> Dict[str, Any]:
+        """
+        Prepare dense layers for the NumPy forward pass
+        
+        Returns the (kernel, bias, activation) layers plus a JIT kernel and
+        its flattened weights when the model has _create_model's shape.
+        """
+        activations = [activation for _, _, activation in layers]
+        forward = None
+        if len(layers) == 4 and activations[:3] == ["relu"] * 3:
+            forward = _FORWARD_KERNELS.get(activations[3])
+        
+        weights = tuple(array for kernel, bias, _ in layers for array in (kernel, bias))
+        if forward is not None:
+            # Compile (or load from cache) now rather than on the first request
+            forward(np.zeros((1, layers[0][0].shape[0]), dtype=np.float32), *weights)
+        
+        return {"layers": layers, "forward": forward, "weights": weights}
+    
+    def _numpy_predict(self, model_type: str, inputs: np.ndarray) -> np.ndarray:
+        """Forward pass of an extracted MLP, JIT-compiled when possible"""
+        mlp = self._numpy_mlps[model_type]
+        x = np.asarray(inputs, dtype=np.float32)
+        if mlp["forward"] is not None:
+            return mlp["forward"](x, *mlp["weights"])
+        
+        for kernel, bias, activation in mlp["layers"]:
+            x = x @ kernel + bias
+            if activation == "relu":
+                np.maximum(x, 0, out=x)
+            elif activation == "sigmoid":
+                x = 1 / (1 + np.exp(-x))
+        return x
+    
+    def _input_row(self, model_type: str, values: Tuple[Any, ...]) -> np.ndarray:
+        """Fill this thread's reusable (1, n) float32 input buffer for a model type"""
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = {}
+        
+        row = buffers.get(model_type)
+        if row is None or row.shape[1] != len(values):
+            row = buffers[model_type] = np.empty((1, len(values)), dtype=np.float32)
+        row[0] = values
+        return row
+    
+    def _has_model(self, model_type: str) -> bool:
+        """Whether a model of this type is available for inference"""
+        return (
+            model_type in self._numpy_mlps
+            or model_type in self._interpreters
+            or model_type in self._predict_fns
+        )
+    
+    def _infer(self, model_type: str, inputs: np.ndarray) -> np.ndarray:
+        """Run inference on float32 inputs with the fastest available model"""
+        # A few hundred FLOPs per sample: plain NumPy beats any TF dispatch
+        if model_type in self._numpy_mlps:
+            return self._numpy_predict(model_type, inputs)
+        if model_type in self._interpreters:
+            return self._tflite_predict(model_type, inputs)
+        return self._predict_fns[model_type](_tf().constant(inputs)).numpy()
+    
+    def _register_model(self, model_type: str, model: "keras.Model") -> None:
+        """Store a model with its NumPy forward pass, or trace its inference function if it has none"""
+        layers = self._extract_layers(model)
+        if layers is not None:
+            mlp = self._build_mlp(layers)
+            with self._lock:
+                self.models[model_type] = model
+                self._numpy_mlps[model_type] = mlp
+                # A new model replaces any other inference path of the previous one
+                self._predict_fns.pop(model_type, None)
+                self._interpreters.pop(model_type, None)
+                self.cache_clear()
+            return
+        
+        # Calling the traced concrete function directly skips the data
+        # pipeline and callback setup that predict() repeats on every call;
+        # XLA compiles the whole forward pass into one fused kernel
+        tf = _tf()
+        input_dim = model.input_shape[1]
+        predict_fn = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec(shape=(None, input_dim), dtype=tf.float32)],
+            jit_compile=True
+        ).get_concrete_function()
+        
+        with self._lock:
+            self.models[model_type] = model
+            self._predict_fns[model_type] = predict_fn
+            self._numpy_mlps.pop(model_type, None)
+            self._interpreters.pop(model_type, None)
+            self.cache_clear()
+    
+    def save_model(self, model_type: str, model: "keras.Model", representative_inputs: Optional[np.ndarray] = None) -> None:
+        """
+        Save model to disk for inference; representative_inputs calibrate int8 conversion
+        
+        The optimizer state is not saved, so loaded models are inference-only;
+        train_model builds and compiles a fresh model anyway. Use
+        save_checkpoint to keep the optimizer for resuming training.
+        """
+        try:
+            n_params = model.count_params()
             model_path = os.path.join(MODEL_DIR, f"{model_type}_model")
-            model.save(model_path)
+            model.save(
+                model_path,
+                include_optimizer=False,
+                save_format="tf",
+                options=_tf().saved_model.SaveOptions(experimental_custom_gradients=False)
+            )
+            self._update_manifest(model_type, "savedmodel", model_path, n_params)
+            
+            # Models with a NumPy forward pass are served from the weight file,
+            # so only the others pay for a TFLite conversion. Saving one format
+            # drops the other's entry, which still describes the previous model
+            layers = self._extract_layers(model)
+            if layers is not None:
+                weights_path = self._save_weights(model_type, layers)
+                self._update_manifest(model_type, "weights", weights_path, n_params)
+                self._drop_manifest_entry(model_type, "tflite")
+            else:
+                tflite_path = self._convert_to_tflite(model_type, model, representative_inputs)
+                self._update_manifest(model_type, "tflite", tflite_path, n_params)
+                self._drop_manifest_entry(model_type, "weights")
+                self._load_tflite(model_type, tflite_path)
             logger.info(f"Saved model: {model_type}")
         except Exception as e:
             logger.error(f"Error saving model: {e}")
     
+    def save_checkpoint(self, model_type: str, model: "keras.Model") -> str:
+        """Save a model's weights with its optimizer state for resuming training; returns the checkpoint path"""
+        tf = _tf()
+        checkpoint = tf.train.Checkpoint(model=model, optimizer=model.optimizer)
+        return checkpoint.write(os.path.join(MODEL_DIR, "checkpoints", model_type))
+    
+    def _save_weights(self, model_type: str, layers: List[Tuple[np.ndarray, np.ndarray, str]]) -> str:
+        """Rewrite the flat weight file with every known model's layers and return its path"""
+        models = {name: mlp["layers"] for name, mlp in self._numpy_mlps.items()}
+        models[model_type] = layers
+        path = os.path.join(MODEL_DIR, WEIGHTS_FILE)
+        _write_weights(path, models)
+        return path
+    
+    def _tflite_path(self, model_type: str) -> str:
+        """Path of the TFLite conversion of a model type"""
+        suffix = "_int8" if model_type in INT8_MODEL_TYPES else ""
+        return os.path.join(MODEL_DIR, f"{model_type}_model{suffix}.tflite")
+    
+    def _convert_to_tflite(self, model_type: str, model: "keras.Model", representative_inputs: Optional[np.ndarray] = None) -> str:
+        """
+        Convert a model to a TFLite FlatBuffer
+        
+        Models in INT8_MODEL_TYPES get int8 weights (dynamic-range quantization),
+        with int8 activations too when representative inputs are given; all
+        others get float16 weights.
+        """
+        tf = _tf()
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        
+        if model_type not in INT8_MODEL_TYPES:
+            converter.target_spec.supported_types = [tf.float16]
+        elif representative_inputs is not None and len(representative_inputs) > 0:
+            def representative_dataset():
+                for i in range(REPRESENTATIVE_SAMPLES):
+                    row = representative_inputs[i % len(representative_inputs)]
+                    yield [np.asarray(row, dtype=np.float32)[None, :]]
+            
+            converter.representative_dataset = representative_dataset
+        
+        tflite_path = self._tflite_path(model_type)
+        with open(tflite_path, "wb") as f:
+            f.write(converter.convert())
+        
+        return tflite_path
+    
     def train_model(self, model_type: str, training_data: Dict[str, List]) -> Dict[str, Any]:
         """
         Train a deep learning model
@@ -84,8 +709,8 @@ class OptimizationEngine:
             training_time = time.time() - start_time
             
             # Save model
-            self.models[model_type] = model
-            self.save_model(model_type, model)
+            self._register_model(model_type, model)
+            self.save_model(model_type, model, inputs)
             
             # Return training results
             return {
@@ -113,14 +738,14 @@ class OptimizationEngine:
         """
         try:
             # Check if model exists
-            if model_type not in self.models:
+            if not self._has_model(model_type):
                 raise ValueError(f"Model not found: {model_type}")
             
             # Convert input data to numpy array
             inputs = np.array(input_data, dtype=np.float32)
             
             # Run prediction
-            predictions = self.models[model_type].predict(inputs)
+            predictions = self._infer(model_type, inputs)
             
             # Convert to list
             return predictions.tolist()
@@ -128,7 +753,7 @@ class OptimizationEngine:
             logger.error(f"Error running prediction: {e}")
             raise ValueError(f"Error running prediction: {e}")
     
-    def optimize_transaction(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def optimize_transaction(self, parameters: Dict[str, Any]) -> TransactionResult:
         """
         Optimize transaction processing
         
@@ -136,51 +761,23 @@ class OptimizationEngine:
             parameters: Optimization parameters
             
         Returns:
-            Optimization results
+            TransactionResult; to_dict() gives the nested original/optimized dict
         """
         try:
-            # Extract parameters
-            tx_count = parameters.get("txCount", 100)
-            block_size = parameters.get("blockSize", 5)
-            network_load = parameters.get("networkLoad", 0.5)
-            fee = parameters.get("fee", 0.005)
-            
             # Check if model exists
-            if "transaction" not in self.models:
+            if not self._has_model("transaction"):
                 # Create a simple model for demonstration
                 self._create_demo_transaction_model()
             
             # Prepare input data
-            input_data = [[tx_count, block_size, network_load, fee]]
-            
-            # Run prediction
-            prediction = self.models["transaction"].predict(np.array(input_data, dtype=np.float32))
-            processing_time = float(prediction[0][0])
-            
-            # Calculate optimized parameters
-            optimized_block_size = min(block_size * 1.2, 10)
-            optimized_fee = fee * (1 + (processing_time / 10))
+            values = _quantize(self._transaction_inputs(parameters))
             
-            # Return optimization results
-            return {
-                "original": {
-                    "txCount": tx_count,
-                    "blockSize": block_size,
-                    "networkLoad": network_load,
-                    "fee": fee,
-                    "processingTime": processing_time
-                },
-                "optimized": {
-                    "blockSize": optimized_block_size,
-                    "fee": optimized_fee,
-                    "estimatedProcessingTime": processing_time * 0.8
-                }
-            }
+            return self._transaction_cache(*values)
         except Exception as e:
             logger.error(f"Error optimizing transaction: {e}")
             raise ValueError(f"Error optimizing transaction: {e}")
     
-    def optimize_contour(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def optimize_contour(self, parameters: Dict[str, Any]) -> ContourResult:
         """
         Optimize geometric contour
         
@@ -188,57 +785,23 @@ class OptimizationEngine:
             parameters: Optimization parameters
             
         Returns:
-            Optimization results
+            ContourResult; to_dict() gives the nested original/optimized dict
         """
         try:
-            # Extract parameters
-            dimensions = parameters.get("dimensions", 3)
-            points = parameters.get("points", 50)
-            complexity = parameters.get("complexity", 50)
-            curvature = parameters.get("curvature", 0.8)
-            length = parameters.get("length", 250)
-            iterations = parameters.get("iterations", 25)
-            
             # Check if model exists
-            if "contour" not in self.models:
+            if not self._has_model("contour"):
                 # Create a simple model for demonstration
                 self._create_demo_contour_model()
             
             # Prepare input data
-            input_data = [[dimensions, points, complexity, curvature, length, iterations]]
-            
-            # Run prediction
-            prediction = self.models["contour"].predict(np.array(input_data, dtype=np.float32))
-            optimized_complexity = float(prediction[0][0])
-            processing_time = float(prediction[0][1])
+            values = _quantize(self._contour_inputs(parameters))
             
-            # Calculate optimized parameters
-            optimized_points = int(points * 1.15)
-            optimized_curvature = curvature * 0.9
-            
-            # Return optimization results
-            return {
-                "original": {
-                    "dimensions": dimensions,
-                    "points": points,
-                    "complexity": complexity,
-                    "curvature": curvature,
-                    "length": length,
-                    "iterations": iterations,
-                    "processingTime": processing_time
-                },
-                "optimized": {
-                    "points": optimized_points,
-                    "curvature": optimized_curvature,
-                    "estimatedComplexity": optimized_complexity,
-                    "estimatedProcessingTime": processing_time * 0.85
-                }
-            }
+            return self._contour_cache(*values)
         except Exception as e:
             logger.error(f"Error optimizing contour: {e}")
             raise ValueError(f"Error optimizing contour: {e}")
     
-    def optimize_network(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    def optimize_network(self, parameters: Dict[str, Any]) -> NetworkResult:
         """
         Optimize network performance
         
@@ -246,68 +809,231 @@ class OptimizationEngine:
             parameters: Optimization parameters
             
         Returns:
-            Optimization results
+            NetworkResult; to_dict() gives the nested original/optimized dict
         """
         try:
-            # Extract parameters
-            node_count = parameters.get("nodeCount", 25)
-            connections = parameters.get("connections", 50)
-            avg_latency = parameters.get("avgLatency", 25)
-            tx_pool_size = parameters.get("txPoolSize", 500)
-            block_size = parameters.get("blockSize", 5)
-            hash_rate = parameters.get("hashRate", 500)
-            difficulty = parameters.get("difficulty", 5)
-            propagation_time = parameters.get("propagationTime", 100)
-            
             # Check if model exists
-            if "network" not in self.models:
+            if not self._has_model("network"):
                 # Create a simple model for demonstration
                 self._create_demo_network_model()
             
             # Prepare input data
-            input_data = [[node_count, connections, avg_latency, tx_pool_size, 
-                          block_size, hash_rate, difficulty, propagation_time]]
+            values = _quantize(self._network_inputs(parameters))
             
-            # Run prediction
-            prediction = self.models["network"].predict(np.array(input_data, dtype=np.float32))
-            throughput = float(prediction[0][0])
-            efficiency = float(prediction[0][1])
-            reliability = float(prediction[0][2])
+            return self._network_cache(*values)
+        except Exception as e:
+            logger.error(f"Error optimizing network: {e}")
+            raise ValueError(f"Error optimizing network: {e}")
+    
+    def optimize_all(self, parameters: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[Any, ...]]:
+        """
+        Optimize transaction processing, contour and network together
+        
+        Args:
+            parameters: Optimization parameters keyed by "transaction",
+                "contour" and "network"
+            
+        Returns:
+            Result tuples keyed the same way
+        """
+        try:
+            # Create demo models for any missing type
+            if not self._has_model("transaction"):
+                self._create_demo_transaction_model()
+            if not self._has_model("contour"):
+                self._create_demo_contour_model()
+            if not self._has_model("network"):
+                self._create_demo_network_model()
             
-            # Calculate optimized parameters
-            optimized_connections = int(connections * 1.1)
-            optimized_latency = avg_latency * 0.85
-            optimized_propagation_time = propagation_time * 0.8
+            # Prepare input data
+            transaction_values = _quantize(self._transaction_inputs(parameters.get("transaction", {})))
+            contour_values = _quantize(self._contour_inputs(parameters.get("contour", {})))
+            network_values = _quantize(self._network_inputs(parameters.get("network", {})))
             
-            # Return optimization results
             return {
-                "original": {
-                    "nodeCount": node_count,
-                    "connections": connections,
-                    "avgLatency": avg_latency,
-                    "txPoolSize": tx_pool_size,
-                    "blockSize": block_size,
-                    "hashRate": hash_rate,
-                    "difficulty": difficulty,
-                    "propagationTime": propagation_time,
-                    "throughput": throughput,
-                    "efficiency": efficiency,
-                    "reliability": reliability
-                },
-                "optimized": {
-                    "connections": optimized_connections,
-                    "avgLatency": optimized_latency,
-                    "propagationTime": optimized_propagation_time,
-                    "estimatedThroughput": throughput * 1.2,
-                    "estimatedEfficiency": min(1.0, efficiency * 1.15),
-                    "estimatedReliability": min(1.0, reliability * 1.05)
-                }
+                "transaction": self._transaction_cache(*transaction_values),
+                "contour": self._contour_cache(*contour_values),
+                "network": self._network_cache(*network_values)
             }
         except Exception as e:
-            logger.error(f"Error optimizing network: {e}")
-            raise ValueError(f"Error optimizing network: {e}")
+            logger.error(f"Error optimizing all: {e}")
+            raise ValueError(f"Error optimizing all: {e}")
+    
+    def optimize_transaction_batch(self, parameters: np.ndarray) -> TransactionResult:
+        """
+        Optimize transaction processing for many parameter sets in one forward pass
+        
+        Args:
+            parameters: (N, 4) array of [txCount, blockSize, networkLoad, fee] rows
+            
+        Returns:
+            TransactionResult with a length-N array in each field
+        """
+        try:
+            # Check if model exists
+            if not self._has_model("transaction"):
+                # Create a simple model for demonstration
+                self._create_demo_transaction_model()
+            
+            inputs = self._batch_inputs("transaction", parameters)
+            return self._transaction_batch_result(inputs, self._infer("transaction", inputs.astype(np.float32)))
+        except Exception as e:
+            logger.error(f"Error optimizing transaction batch: {e}")
+            raise ValueError(f"Error optimizing transaction batch: {e}")
+    
+    def optimize_contour_batch(self, parameters: np.ndarray) -> ContourResult:
+        """
+        Optimize geometric contour for many parameter sets in one forward pass
+        
+        Args:
+            parameters: (N, 6) array of [dimensions, points, complexity,
+                curvature, length, iterations] rows
+            
+        Returns:
+            ContourResult with a length-N array in each field
+        """
+        try:
+            # Check if model exists
+            if not self._has_model("contour"):
+                # Create a simple model for demonstration
+                self._create_demo_contour_model()
+            
+            inputs = self._batch_inputs("contour", parameters)
+            return self._contour_batch_result(inputs, self._infer("contour", inputs.astype(np.float32)))
+        except Exception as e:
+            logger.error(f"Error optimizing contour batch: {e}")
+            raise ValueError(f"Error optimizing contour batch: {e}")
+    
+    def optimize_network_batch(self, parameters: np.ndarray) -> NetworkResult:
+        """
+        Optimize network performance for many parameter sets in one forward pass
+        
+        Args:
+            parameters: (N, 8) array of [nodeCount, connections, avgLatency,
+                txPoolSize, blockSize, hashRate, difficulty, propagationTime] rows
+            
+        Returns:
+            NetworkResult with a length-N array in each field
+        """
+        try:
+            # Check if model exists
+            if not self._has_model("network"):
+                # Create a simple model for demonstration
+                self._create_demo_network_model()
+            
+            inputs = self._batch_inputs("network", parameters)
+            return self._network_batch_result(inputs, self._infer("network", inputs.astype(np.float32)))
+        except Exception as e:
+            logger.error(f"Error optimizing network batch: {e}")
+            raise ValueError(f"Error optimizing network batch: {e}")
+    
+    def _batch_inputs(self, model_type: str, parameters: np.ndarray) -> np.ndarray:
+        """Validate a batch of parameter rows for a model type"""
+        inputs = np.asarray(parameters, dtype=np.float64)
+        n_features = len(MODEL_FEATURES[model_type])
+        if inputs.ndim != 2 or inputs.shape[1] != n_features:
+            raise ValueError(f"Expected an (N, {n_features}) array, got shape {inputs.shape}")
+        return inputs
+    
+    def _optimize_transaction_core(self, *values: Any) -> TransactionResult:
+        """Predict and post-process transaction optimization, bypassing the result cache"""
+        inputs = np.array([values], dtype=np.float64)
+        predictions = self._infer("transaction", self._input_row("transaction", values))
+        return _result_row(self._transaction_batch_result(inputs, predictions), values)
     
-    def _create_model(self, model_type: str, input_dim: int, output_dim: int) -> keras.Model:
+    def _optimize_contour_core(self, *values: Any) -> ContourResult:
+        """Predict and post-process contour optimization, bypassing the result cache"""
+        inputs = np.array([values], dtype=np.float64)
+        predictions = self._infer("contour", self._input_row("contour", values))
+        return _result_row(self._contour_batch_result(inputs, predictions), values)
+    
+    def _optimize_network_core(self, *values: Any) -> NetworkResult:
+        """Predict and post-process network optimization, bypassing the result cache"""
+        inputs = np.array([values], dtype=np.float64)
+        predictions = self._infer("network", self._input_row("network", values))
+        return _result_row(self._network_batch_result(inputs, predictions), values)
+    
+    def _transaction_inputs(self, parameters: Dict[str, Any]) -> List[float]:
+        """Transaction model features: [txCount, blockSize, networkLoad, fee]"""
+        return [
+            parameters.get("txCount", 100),
+            parameters.get("blockSize", 5),
+            parameters.get("networkLoad", 0.5),
+            parameters.get("fee", 0.005)
+        ]
+    
+    def _transaction_batch_result(self, inputs: np.ndarray, predictions: np.ndarray) -> TransactionResult:
+        """Build transaction optimization results from float64 inputs and model predictions"""
+        tx_count, block_size, network_load, fee = inputs.T
+        processing_time = predictions[:, 0].astype(np.float64)
+        
+        # Calculate optimized parameters
+        optimized_block_size = np.minimum(block_size * 1.2, 10)
+        optimized_fee = fee * (1 + (processing_time / 10))
+        
+        return TransactionResult(
+            tx_count, block_size, network_load, fee, processing_time,
+            optimized_block_size, optimized_fee, processing_time * 0.8
+        )
+    
+    def _contour_inputs(self, parameters: Dict[str, Any]) -> List[float]:
+        """Contour model features: [dimensions, points, complexity, curvature, length, iterations]"""
+        return [
+            parameters.get("dimensions", 3),
+            parameters.get("points", 50),
+            parameters.get("complexity", 50),
+            parameters.get("curvature", 0.8),
+            parameters.get("length", 250),
+            parameters.get("iterations", 25)
+        ]
+    
+    def _contour_batch_result(self, inputs: np.ndarray, predictions: np.ndarray) -> ContourResult:
+        """Build contour optimization results from float64 inputs and model predictions"""
+        dimensions, points, complexity, curvature, length, iterations = inputs.T
+        optimized_complexity = predictions[:, 0].astype(np.float64)
+        processing_time = predictions[:, 1].astype(np.float64)
+        
+        # Calculate optimized parameters
+        optimized_points = (points * 1.15).astype(np.int64)
+        optimized_curvature = curvature * 0.9
+        
+        return ContourResult(
+            dimensions, points, complexity, curvature, length, iterations, processing_time,
+            optimized_points, optimized_curvature, optimized_complexity, processing_time * 0.85
+        )
+    
+    def _network_inputs(self, parameters: Dict[str, Any]) -> List[float]:
+        """Network model features: [nodeCount, connections, avgLatency, txPoolSize, blockSize, hashRate, difficulty, propagationTime]"""
+        return [
+            parameters.get("nodeCount", 25),
+            parameters.get("connections", 50),
+            parameters.get("avgLatency", 25),
+            parameters.get("txPoolSize", 500),
+            parameters.get("blockSize", 5),
+            parameters.get("hashRate", 500),
+            parameters.get("difficulty", 5),
+            parameters.get("propagationTime", 100)
+        ]
+    
+    def _network_batch_result(self, inputs: np.ndarray, predictions: np.ndarray) -> NetworkResult:
+        """Build network optimization results from float64 inputs and model predictions"""
+        (node_count, connections, avg_latency, tx_pool_size,
+         block_size, hash_rate, difficulty, propagation_time) = inputs.T
+        throughput, efficiency, reliability = predictions[:, :3].T.astype(np.float64)
+        
+        # Calculate optimized parameters
+        optimized_connections = (connections * 1.1).astype(np.int64)
+        optimized_latency = avg_latency * 0.85
+        optimized_propagation_time = propagation_time * 0.8
+        
+        return NetworkResult(
+            node_count, connections, avg_latency, tx_pool_size, block_size, hash_rate,
+            difficulty, propagation_time, throughput, efficiency, reliability,
+            optimized_connections, optimized_latency, optimized_propagation_time,
+            throughput * 1.2, np.minimum(1.0, efficiency * 1.15), np.minimum(1.0, reliability * 1.05)
+        )
+    
+    def _create_model(self, model_type: str, input_dim: int, output_dim: int) -> "keras.Model":
         """
         Create a deep learning model
         
@@ -319,6 +1045,7 @@ class OptimizationEngine:
         Returns:
             Keras model
         """
+        keras = _tf().keras
         model = keras.Sequential()
         
         if model_type == "transaction":
@@ -339,15 +1066,41 @@ class OptimizationEngine:
         else:
             raise ValueError(f"Unknown model type: {model_type}")
         
-        # Compile model
-        model.compile(
-            optimizer=keras.optimizers.Adam(0.001),
-            loss="mean_squared_error",
-            metrics=["mse"]
-        )
+        # Compile model; XLA fuses each training step into a single kernel
+        try:
+            model.compile(
+                optimizer=keras.optimizers.Adam(0.001),
+                loss="mean_squared_error",
+                metrics=["mse"],
+                jit_compile=True
+            )
+        except TypeError:
+            # Keras releases without the jit_compile argument
+            model.compile(
+                optimizer=keras.optimizers.Adam(0.001),
+                loss="mean_squared_error",
+                metrics=["mse"]
+            )
         
         return model
     
+    def _fit_demo(self, model: "keras.Model", inputs: np.ndarray, outputs: np.ndarray) -> None:
+        """Fit a demo model with a traced gradient step instead of fit()"""
+        tf = _tf()
+        x = tf.constant(inputs)
+        y = tf.constant(outputs)
+        optimizer = model.optimizer
+        
+        @tf.function
+        def step():
+            with tf.GradientTape() as tape:
+                loss = tf.reduce_mean(tf.square(model(x, training=True) - y))
+            gradients = tape.gradient(loss, model.trainable_variables)
+            optimizer.apply_gradients(zip(gradients, model.trainable_variables))
+        
+        for _ in range(DEMO_TRAINING_STEPS):
+            step()
+    
     def _create_demo_transaction_model(self) -> None:
         """Create a demo transaction model"""
         # Features: [txCount, blockSize, networkLoad, fee]
@@ -380,10 +1133,10 @@ class OptimizationEngine:
         
         # Create and train model
         model = self._create_model("transaction", inputs.shape[1], outputs.shape[1])
-        model.fit(inputs, outputs, epochs=100, batch_size=32, verbose=0)
+        self._fit_demo(model, inputs, outputs)
         
         # Save model
-        self.models["transaction"] = model
+        self._register_model("transaction", model)
         self.save_model("transaction", model)
     
     def _create_demo_contour_model(self) -> None:
@@ -418,10 +1171,10 @@ class OptimizationEngine:
         
         # Create and train model
         model = self._create_model("contour", inputs.shape[1], outputs.shape[1])
-        model.fit(inputs, outputs, epochs=100, batch_size=32, verbose=0)
+        self._fit_demo(model, inputs, outputs)
         
         # Save model
-        self.models["contour"] = model
+        self._register_model("contour", model)
         self.save_model("contour", model)
     
     def _create_demo_network_model(self) -> None:
@@ -456,11 +1209,21 @@ class OptimizationEngine:
         
         # Create and train model
         model = self._create_model("network", inputs.shape[1], outputs.shape[1])
-        model.fit(inputs, outputs, epochs=100, batch_size=32, verbose=0)
+        self._fit_demo(model, inputs, outputs)
         
         # Save model
-        self.models["network"] = model
-        self.save_model("network", model)
+        self._register_model("network", model)
+        self.save_model("network", model, inputs)
+
+# Global optimization engine, created on first use
+_engine = None
+_engine_lock = threading.Lock()
 
-# Create global optimization engine
-optimization_engine = OptimizationEngine()
\ No newline at end of file
+def get_engine() -> OptimizationEngine:
+    """Return the global optimization engine, creating it on first call"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = OptimizationEngine()
+    return _engine
\ No newline at end of file
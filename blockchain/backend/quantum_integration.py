@@ -8,21 +8,30 @@ import logging
 import time
 import os
 import json
-from typing import Dict, List, Any, Optional, Tuple, Union
+import copy
+from typing import Dict, List, Any, Optional, Tuple, Union, Iterator
 import threading
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 
 # Quantum computing libraries
 try:
     import qiskit
-    from qiskit import Aer, execute, QuantumCircuit, QuantumRegister, ClassicalRegister
-    from qiskit.algorithms import VQE, QAOA, Grover, AmplificationProblem
-    from qiskit.algorithms.optimizers import COBYLA, SPSA, ADAM
+    from qiskit import transpile, QuantumCircuit, QuantumRegister, ClassicalRegister
+    from qiskit.algorithms import QAOA, Grover, AmplificationProblem
+    from qiskit.algorithms.minimum_eigensolvers import VQE
+    from qiskit.algorithms.optimizers import COBYLA, ADAM
     from qiskit.circuit.library import TwoLocal, ZZFeatureMap, PauliFeatureMap
+    from qiskit.quantum_info import SparsePauliOp
+    from qiskit.opflow import PauliSumOp
     from qiskit.utils import algorithm_globals
     from qiskit_machine_learning.algorithms import VQC, QSVC
     from qiskit_machine_learning.kernels import QuantumKernel
     from qiskit_machine_learning.neural_networks import TwoLayerQNN, CircuitQNN
+    from qiskit_aer import AerSimulator
+    from qiskit_aer.primitives import Estimator
+    import scipy.sparse.linalg
     QUANTUM_AVAILABLE = True
 except ImportError:
     # Fallback to classical computing if quantum libraries are not available
@@ -32,6 +41,29 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger("kontourcoin-quantum")
 
+# Largest operators solved exactly instead of by VQE when exact_small_problems
+# is set, and the matrix size up to which a dense eigensolver beats ARPACK
+EXACT_EIGENSOLVER_MAX_QUBITS = 20
+DENSE_EIGENSOLVER_MAX_DIM = 64
+
+# Convergence tolerance of the variational optimizers; most problems stop
+# well before the iteration limit once updates fall below it
+OPTIMIZER_MAX_ITER = 100
+OPTIMIZER_TOL = 1e-3
+
+# Upper bound on threads evaluating VQE samples concurrently
+VQE_MAX_WORKERS = 10
+
+# Circuits this wide run on the GPU simulator when one is available; below
+# this the transfer and launch overhead outweighs the faster statevector math
+GPU_MIN_QUBITS = 15
+
+# Bounds on the trained models, finished training job statuses and
+# optimization results kept in memory, as (max entries, seconds before expiry)
+MODEL_CACHE_LIMITS = (32, 3600)
+TRAINING_STATUS_LIMITS = (256, 7200)
+OPTIMIZATION_RESULT_LIMITS = (256, 3600)
+
 # Set random seed for reproducibility
 algorithm_globals.random_seed = 42
 
@@ -41,18 +73,47 @@ class QuantumComputingEngine:
     Provides quantum-enhanced AI training and optimization
     """
     
-    def __init__(self, use_real_quantum_hardware: bool = False):
+    def __init__(self, use_real_quantum_hardware: bool = False, exact_small_problems: bool = True,
+                 use_gpu: bool = True):
         """
         Initialize the quantum computing engine
         
         Args:
             use_real_quantum_hardware: Whether to use real quantum hardware (if available)
+            exact_small_problems: Whether to diagonalize small regressor operators
+                classically instead of running VQE on the backend
+            use_gpu: Whether to simulate large circuits on a GPU (if available)
         """
         self.use_real_quantum_hardware = use_real_quantum_hardware
+        self.exact_small_problems = exact_small_problems
+        self.use_gpu = use_gpu
         self.backend = self._initialize_quantum_backend()
-        self.models = {}
-        self.optimization_results = {}
-        self.training_status = {}
+        self.gpu_backend = self._initialize_gpu_backend()
+        self.models = TTLCache(*MODEL_CACHE_LIMITS)
+        self._model_caps = TTLCache(*MODEL_CACHE_LIMITS)
+        self.optimization_results = TTLCache(*OPTIMIZATION_RESULT_LIMITS)
+        self.training_status = TTLCache(*TRAINING_STATUS_LIMITS)
+        # Statuses of queued and running jobs, which must not expire; they
+        # move to training_status once the job completes or fails
+        self._active_training = {}
+        self._state_lock = threading.RLock()
+        
+        # VQE ansatz circuits transpiled once per qubit count, shared across
+        # samples and models, and a pool evaluating samples concurrently;
+        # each worker thread keeps its own estimator
+        self._ansatz_templates = {}
+        self._local = threading.local()
+        self._vqe_executor = ThreadPoolExecutor(max_workers=min(VQE_MAX_WORKERS, os.cpu_count() or 1))
+        
+        # Optimization circuit stats and transpiled forms by (type, qubits)
+        self._circuit_cache = {}
+        
+        # Optimal QAOA angles last found per (algorithm, problem size), used
+        # as the starting point of the next run of that size
+        self._warm_starts = {}
+        
+        # Training jobs queue on a bounded pool instead of a thread each
+        self._training_executor = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 1) // 2))
         
     def _initialize_quantum_backend(self):
         """Initialize the quantum backend"""
@@ -79,15 +140,47 @@ class QuantumComputingEngine:
                 except Exception as e:
                     logger.warning(f"Could not access real quantum hardware: {e}")
             
-            # Fallback to simulator
-            backend = Aer.get_backend('qasm_simulator')
-            logger.info("Using QASM simulator backend")
+            # Fallback to simulator; with measurements only at the end of a
+            # circuit it evolves the statevector once and samples every shot
+            # from it, and the shot count is set here rather than per run
+            backend = AerSimulator(method='statevector')
+            backend.set_options(shots=1024)
+            logger.info("Using Aer statevector simulator backend")
             return backend
             
         except Exception as e:
             logger.error(f"Error initializing quantum backend: {e}")
             return None
     
+    def _initialize_gpu_backend(self):
+        """Initialize a GPU statevector simulator for large circuits, if one is available"""
+        if not self.use_gpu or self.backend is None:
+            return None
+        
+        # Circuits meant for real hardware stay on it
+        if not getattr(self.backend.configuration(), "simulator", False):
+            return None
+            
+        try:
+            if "GPU" not in AerSimulator().available_devices():
+                logger.info("No GPU simulator device; all circuits run on the CPU")
+                return None
+            
+            backend = AerSimulator(method='statevector', device='GPU', cuStateVec_enable=True)
+            backend.set_options(shots=1024)
+            logger.info(f"Using GPU statevector simulator for circuits of {GPU_MIN_QUBITS}+ qubits")
+            return backend
+            
+        except Exception as e:
+            logger.warning(f"Could not initialize GPU simulator: {e}")
+            return None
+    
+    def _backend_for(self, num_qubits: int):
+        """Backend to run a circuit of the given width on"""
+        if self.gpu_backend is not None and num_qubits >= GPU_MIN_QUBITS:
+            return self.gpu_backend
+        return self.backend
+    
     def is_quantum_available(self) -> bool:
         """Check if quantum computing is available"""
         return QUANTUM_AVAILABLE and self.backend is not None
@@ -100,13 +193,18 @@ class QuantumComputingEngine:
                 "reason": "Quantum computing libraries not available or backend initialization failed"
             }
         
+        with self._state_lock:
+            models = list(self.models.keys())
+            optimizations = list(self.optimization_results.keys())
+        
         return {
             "available": True,
             "backend_name": self.backend.name(),
             "is_simulator": "simulator" in self.backend.name().lower(),
             "max_qubits": getattr(self.backend.configuration(), "n_qubits", "unknown"),
-            "models": list(self.models.keys()),
-            "optimizations": list(self.optimization_results.keys())
+            "gpu_available": self.gpu_backend is not None,
+            "models": models,
+            "optimizations": optimizations
         }
     
     def train_quantum_model(self, model_type: str, training_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -134,18 +232,18 @@ class QuantumComputingEngine:
         job_id = f"{model_type}_{int(time.time())}"
         
         # Set initial training status
-        self.training_status[job_id] = {
-            "status": "started",
-            "progress": 0,
-            "model_type": model_type,
-            "start_time": time.time()
-        }
+        with self._state_lock:
+            self._active_training[job_id] = {
+                "status": "started",
+                "progress": 0,
+                "model_type": model_type,
+                "start_time": time.time()
+            }
         
-        # Start training in a separate thread
-        threading.Thread(
-            target=self._train_model_thread,
-            args=(job_id, model_type, x_train, y_train, training_data)
-        ).start()
+        # Queue training on the training pool
+        self._training_executor.submit(
+            self._train_model_thread, job_id, model_type, x_train, y_train, training_data
+        )
         
         return {
             "job_id": job_id,
@@ -163,7 +261,7 @@ class QuantumComputingEngine:
         """Background thread for model training"""
         try:
             # Update status
-            self.training_status[job_id]["status"] = "training"
+            self._set_training_status(job_id, status="training")
             
             # Select the appropriate quantum model based on type
             if model_type == "quantum_classifier":
@@ -176,24 +274,38 @@ class QuantumComputingEngine:
                 raise ValueError(f"Unknown quantum model type: {model_type}")
             
             # Store the trained model
-            self.models[job_id] = model
-            
-            # Update status
-            self.training_status[job_id].update({
-                "status": "completed",
-                "progress": 100,
-                "completion_time": time.time(),
-                "training_time": time.time() - self.training_status[job_id]["start_time"],
-                "result": result
-            })
+            completion_time = time.time()
+            with self._state_lock:
+                self.models[job_id] = model
+                # What prediction needs to know about the model, found once
+                self._model_caps[job_id] = {
+                    "type": model_type,
+                    "has_proba": hasattr(model, "predict_proba")
+                }
+                
+                # Update status
+                start_time = self._active_training.get(job_id, {}).get("start_time", completion_time)
+                self._set_training_status(
+                    job_id,
+                    status="completed",
+                    progress=100,
+                    completion_time=completion_time,
+                    training_time=completion_time - start_time,
+                    result=result
+                )
             
         except Exception as e:
             logger.error(f"Error training quantum model: {e}")
-            self.training_status[job_id].update({
-                "status": "failed",
-                "error": str(e),
-                "completion_time": time.time()
-            })
+            self._set_training_status(job_id, status="failed", error=str(e),
+                                      completion_time=time.time())
+    
+    def _set_training_status(self, job_id: str, **fields) -> None:
+        """Update fields of a training job's status; finished jobs move to the bounded store"""
+        with self._state_lock:
+            status = self._active_training.setdefault(job_id, {})
+            status.update(fields)
+            if status.get("status") in ("completed", "failed"):
+                self.training_status[job_id] = self._active_training.pop(job_id)
     
     def _train_quantum_classifier(self, x_train: np.ndarray, y_train: np.ndarray, 
                                  training_data: Dict[str, Any], job_id: str) -> Tuple[Any, Dict[str, Any]]:
@@ -210,22 +322,22 @@ class QuantumComputingEngine:
         var_form = TwoLocal(num_qubits, ['ry', 'rz'], 'cz', reps=3)
         
         # Update status
-        self.training_status[job_id]["progress"] = 20
+        self._set_training_status(job_id, progress=20)
         
         # Create quantum kernel
-        quantum_kernel = QuantumKernel(feature_map=feature_map, quantum_instance=self.backend)
+        quantum_kernel = QuantumKernel(feature_map=feature_map, quantum_instance=self._backend_for(feature_map.num_qubits))
         
         # Create and train quantum SVM classifier
         qsvc = QSVC(quantum_kernel=quantum_kernel)
         
         # Update status
-        self.training_status[job_id]["progress"] = 40
+        self._set_training_status(job_id, progress=40)
         
         # Fit the model
         qsvc.fit(x_train, y_train)
         
         # Update status
-        self.training_status[job_id]["progress"] = 80
+        self._set_training_status(job_id, progress=80)
         
         # Evaluate on training data
         y_pred = qsvc.predict(x_train)
@@ -256,41 +368,37 @@ class QuantumComputingEngine:
         ansatz = TwoLocal(num_qubits, ['ry', 'rz'], 'cz', reps=3, entanglement='full')
         
         # Update status
-        self.training_status[job_id]["progress"] = 20
+        self._set_training_status(job_id, progress=20)
         
         # Create quantum neural network
         qnn = TwoLayerQNN(
             num_qubits=num_qubits,
             feature_map=feature_map,
             ansatz=ansatz,
-            quantum_instance=self.backend
+            quantum_instance=self._backend_for(num_qubits)
         )
         
         # Update status
-        self.training_status[job_id]["progress"] = 40
+        self._set_training_status(job_id, progress=40)
         
         # Create optimizer
-        optimizer = SPSA(maxiter=100)
+        optimizer = COBYLA(maxiter=OPTIMIZER_MAX_ITER, tol=OPTIMIZER_TOL)
         
-        # Create VQE instance
-        vqe = VQE(ansatz=ansatz, optimizer=optimizer, quantum_instance=self.backend)
+        # Create VQE instance; the ansatz is set per operator width
+        vqe = VQE(self._get_estimator(), ansatz, optimizer)
         
         # Update status
-        self.training_status[job_id]["progress"] = 60
+        self._set_training_status(job_id, progress=60)
         
         # Train on each data point (simplified approach)
         predictions = []
         mse = 0
         
-        for i, (x, y) in enumerate(zip(x_train[:10], y_train[:10])):  # Limit to first 10 for demo
-            # Update feature map parameters based on input
-            params = {}
-            for j, val in enumerate(x):
-                params[j] = val
-                
-            # Run VQE with these parameters
-            result = vqe.compute_minimum_eigenvalue(operator=self._create_simple_operator(params))
-            prediction = result.eigenvalue.real
+        # Each input row parameterizes the operator (first 10 for demo)
+        samples = np.asarray(x_train[:10], dtype=np.float64)
+        
+        # Run VQE with these parameters; samples are independent
+        for i, (prediction, y) in enumerate(zip(self._vqe_eigenvalues(vqe, samples), y_train[:10])):
             predictions.append(prediction)
             
             # Calculate error
@@ -299,7 +407,7 @@ class QuantumComputingEngine:
             
             # Update progress
             progress = 60 + (i / min(10, len(x_train))) * 30
-            self.training_status[job_id]["progress"] = progress
+            self._set_training_status(job_id, progress=progress)
         
         mse /= min(10, len(x_train))
         
@@ -327,32 +435,35 @@ class QuantumComputingEngine:
         weights = [1.0] * len(edges)
         
         # Update status
-        self.training_status[job_id]["progress"] = 20
+        self._set_training_status(job_id, progress=20)
         
         # Create the max-cut operator
         qubit_op = self._create_maxcut_operator(edges, weights)
         
         # Update status
-        self.training_status[job_id]["progress"] = 40
+        self._set_training_status(job_id, progress=40)
         
-        # Create QAOA instance
+        # Create QAOA instance, starting from the last solution of this size
+        warm_start_key = ("qaoa", num_nodes)
         qaoa = QAOA(
-            optimizer=COBYLA(maxiter=100),
+            optimizer=COBYLA(maxiter=OPTIMIZER_MAX_ITER, tol=OPTIMIZER_TOL),
             reps=3,
-            quantum_instance=self.backend
+            initial_point=self._warm_starts.get(warm_start_key),
+            quantum_instance=self._backend_for(num_nodes)
         )
         
         # Update status
-        self.training_status[job_id]["progress"] = 60
+        self._set_training_status(job_id, progress=60)
         
-        # Run QAOA
-        result = qaoa.compute_minimum_eigenvalue(qubit_op)
+        # Run QAOA; this QAOA takes opflow operators, so wrap the Pauli sum
+        result = qaoa.compute_minimum_eigenvalue(PauliSumOp(qubit_op))
+        self._warm_starts[warm_start_key] = np.asarray(result.optimal_point)
         
         # Update status
-        self.training_status[job_id]["progress"] = 80
+        self._set_training_status(job_id, progress=80)
         
         # Process results
-        x = self._sample_most_likely(result.eigenstate)
+        x = self._sample_most_likely(result.eigenstate, num_nodes)
         graph_solution = self._get_graph_solution(x)
         
         # Return model and results
@@ -366,50 +477,90 @@ class QuantumComputingEngine:
         
         return qaoa, result_dict
     
-    def _create_simple_operator(self, params):
+    def _get_estimator(self) -> "Estimator":
+        """This thread's estimator primitive; circuits are transpiled before they reach it"""
+        estimator = getattr(self._local, "estimator", None)
+        if estimator is None:
+            estimator = self._local.estimator = Estimator(run_options={"shots": 1024}, skip_transpilation=True)
+        return estimator
+    
+    def _ansatz_template(self, num_qubits: int) -> "QuantumCircuit":
+        """VQE ansatz for a qubit count, transpiled on first use"""
+        template = self._ansatz_templates.get(num_qubits)
+        if template is None:
+            ansatz = TwoLocal(num_qubits, ['ry', 'rz'], 'cz', reps=3, entanglement='full')
+            template = transpile(ansatz, self.backend, optimization_level=1)
+            self._ansatz_templates[num_qubits] = template
+        return template
+    
+    def _vqe_eigenvalue(self, vqe: "VQE", params: np.ndarray) -> float:
+        """Minimum eigenvalue of the simple operator for one sample"""
+        operator = self._create_simple_operator(params)
+        
+        if self.exact_small_problems and operator.num_qubits <= EXACT_EIGENSOLVER_MAX_QUBITS:
+            # Exact, and far cheaper than hundreds of sampled circuit runs
+            return self._exact_min_eigenvalue(operator)
+        
+        # Evaluations only bind parameter values into the cached template; a
+        # solver per call keeps concurrent samples from sharing state
+        solver = VQE(
+            self._get_estimator(),
+            self._ansatz_template(operator.num_qubits),
+            copy.copy(vqe.optimizer)
+        )
+        return solver.compute_minimum_eigenvalue(operator=operator).eigenvalue.real
+    
+    def _vqe_eigenvalues(self, vqe: "VQE", samples: np.ndarray) -> Iterator[float]:
+        """Minimum eigenvalues for several samples, yielded in order"""
+        if self.exact_small_problems:
+            # Exact solves take microseconds; threads would only add overhead
+            return (self._vqe_eigenvalue(vqe, params) for params in samples)
+        
+        # Aer releases the GIL while simulating, so samples run in parallel
+        return self._vqe_executor.map(lambda params: self._vqe_eigenvalue(vqe, params), samples)
+    
+    def _exact_min_eigenvalue(self, operator) -> float:
+        """Smallest eigenvalue of an operator from its sparse matrix"""
+        matrix = operator.to_matrix(sparse=True)
+        if matrix.shape[0] <= DENSE_EIGENSOLVER_MAX_DIM:
+            return float(np.linalg.eigvalsh(matrix.toarray())[0])
+        eigenvalues, _ = scipy.sparse.linalg.eigsh(matrix, k=1, which='SA')
+        return float(eigenvalues[0])
+    
+    def _create_simple_operator(self, params: np.ndarray):
         """Create a simple Hamiltonian operator for VQE"""
-        from qiskit.opflow import X, Y, Z, I
-        
         # Create a simple parameterized Hamiltonian
         # This is a simplified example - in practice, you would create an operator
         # that represents your specific problem
         
-        # Start with identity
-        op = I
-        
-        # Add terms based on parameters
-        for i, val in enumerate(params):
-            if i == 0:
-                op = op + val * X
-            elif i == 1:
-                op = op + val * Y
-            elif i == 2:
-                op = op + val * Z
-            else:
-                break
+        # Identity plus X, Y and Z weighted by the first three parameters
+        num_terms = min(len(params), 3)
+        coeffs = np.empty(num_terms + 1)
+        coeffs[0] = 1.0
+        coeffs[1:] = params[:num_terms]
                 
-        return op
+        return SparsePauliOp(list("IXYZ"[:num_terms + 1]), coeffs)
     
     def _create_maxcut_operator(self, edges, weights):
         """Create a Hamiltonian operator for the MaxCut problem"""
-        from qiskit.opflow import X, Y, Z, I
+        # Create the cost Hamiltonian for MaxCut: the sum over edges of
+        # w * (I - Z_u Z_v) / 2
+        num_qubits = max(max(u, v) for u, v in edges) + 1
+        terms = [("ZZ", [u, v], -w / 2) for (u, v), w in zip(edges, weights)]
+        terms.append(("", [], sum(weights) / 2))
         
-        # Create the cost Hamiltonian for MaxCut
-        cost_operator = 0
-        
-        for i, (u, v) in enumerate(edges):
-            w = weights[i]
-            cost_operator += w * (I - Z[u] @ Z[v]) / 2
-                
-        return cost_operator
+        return SparsePauliOp.from_sparse_list(terms, num_qubits=num_qubits).simplify()
     
-    def _sample_most_likely(self, state_vector):
+    def _sample_most_likely(self, state_vector, num_qubits: Optional[int] = None):
         """Returns the binary string with the highest probability"""
-        n = int(np.log2(len(state_vector)))
-        max_amplitude = max(np.abs(state_vector))
-        max_amplitude_idx = np.where(np.abs(state_vector) == max_amplitude)[0][0]
+        state_vector = np.asarray(state_vector)
+        # Derive the width from the power-of-two size without floating point
+        n = num_qubits if num_qubits is not None else state_vector.size.bit_length() - 1
         
-        return bin(max_amplitude_idx)[2:].zfill(n)
+        # One pass; argmax returns the first index on ties, as before
+        max_amplitude_idx = int(np.argmax(np.abs(state_vector)))
+        
+        return format(max_amplitude_idx, f'0{n}b')
     
     def _get_graph_solution(self, x):
         """Convert binary string to graph solution"""
@@ -435,10 +586,12 @@ class QuantumComputingEngine:
         Returns:
             Training status
         """
-        if job_id not in self.training_status:
-            raise ValueError(f"Training job not found: {job_id}")
-            
-        return self.training_status[job_id]
+        with self._state_lock:
+            status = self._active_training.get(job_id) or self.training_status.get(job_id)
+            if status is None:
+                raise ValueError(f"Training job not found: {job_id}")
+                
+            return dict(status)
     
     def predict_with_quantum_model(self, job_id: str, input_data: List[List[float]]) -> Dict[str, Any]:
         """
@@ -454,12 +607,14 @@ class QuantumComputingEngine:
         if not self.is_quantum_available():
             raise ValueError("Quantum computing is not available")
             
-        if job_id not in self.models:
-            raise ValueError(f"Model not found: {job_id}")
-            
-        # Get the model
-        model = self.models[job_id]
-        model_type = self.training_status[job_id]["model_type"]
+        with self._state_lock:
+            if job_id not in self.models:
+                raise ValueError(f"Model not found: {job_id}")
+                
+            # Get the model; its capabilities were stored right after it
+            model = self.models[job_id]
+            caps = self._model_caps[job_id]
+        model_type = caps["type"]
         
         # Convert input data to numpy array
         inputs = np.array(input_data, dtype=np.float32)
@@ -467,7 +622,7 @@ class QuantumComputingEngine:
         # Make predictions based on model type
         if model_type == "quantum_classifier":
             predictions = model.predict(inputs).tolist()
-            probabilities = model.predict_proba(inputs).tolist() if hasattr(model, "predict_proba") else None
+            probabilities = model.predict_proba(inputs).tolist() if caps["has_proba"] else None
             
             return {
                 "predictions": predictions,
@@ -477,19 +632,9 @@ class QuantumComputingEngine:
             }
             
         elif model_type == "quantum_regressor":
-            # For VQE, we need to run inference manually
-            predictions = []
-            
-            for x in inputs:
-                # Update feature map parameters based on input
-                params = {}
-                for j, val in enumerate(x):
-                    params[j] = val
-                    
-                # Run VQE with these parameters
-                result = model.compute_minimum_eigenvalue(operator=self._create_simple_operator(params))
-                prediction = result.eigenvalue.real
-                predictions.append(prediction)
+            # For VQE, we need to run inference manually; each input row
+            # parameterizes the operator. Samples are independent
+            predictions = list(self._vqe_eigenvalues(model, inputs))
                 
             return {
                 "predictions": predictions,
@@ -499,9 +644,10 @@ class QuantumComputingEngine:
             
         elif model_type == "quantum_optimizer":
             # For QAOA, we return the optimization solution
+            result = self.get_training_status(job_id)["result"]
             return {
-                "solution": self.training_status[job_id]["result"]["solution"],
-                "energy": self.training_status[job_id]["result"]["energy"],
+                "solution": result["solution"],
+                "energy": result["energy"],
                 "model_type": model_type,
                 "job_id": job_id
             }
@@ -514,30 +660,50 @@ class QuantumComputingEngine:
         Perform quantum-enhanced optimization
         
         Args:
-            optimization_type: Type of optimization to perform
-            parameters: Optimization parameters
+            optimization_type: Type of optimization to perform, or
+                "all_optimization" to run every type in one batch
+            parameters: Optimization parameters; for "all_optimization",
+                parameters keyed by optimization type
             
         Returns:
             Optimization results
         """
         if not self.is_quantum_available():
             raise ValueError("Quantum computing is not available")
+        
+        # Circuit width, builder and result post-processing per optimization type
+        handlers = {
+            "transaction_optimization": (self._transactions_qubits, self._build_transactions_circuit, self._transactions_result),
+            "contour_optimization": (self._contours_qubits, self._build_contours_circuit, self._contours_result),
+            "network_optimization": (self._network_qubits, self._build_network_circuit, self._network_result)
+        }
+        
+        if optimization_type == "all_optimization":
+            requested = {name: parameters.get(name, {}) for name in handlers}
+        elif optimization_type in handlers:
+            requested = {optimization_type: parameters}
+        else:
+            raise ValueError(f"Unknown optimization type: {optimization_type}")
             
         # Generate a unique ID for this optimization
         job_id = f"{optimization_type}_{int(time.time())}"
         
-        # Perform optimization based on type
-        if optimization_type == "transaction_optimization":
-            result = self._optimize_transactions(parameters)
-        elif optimization_type == "contour_optimization":
-            result = self._optimize_contours(parameters)
-        elif optimization_type == "network_optimization":
-            result = self._optimize_network(parameters)
-        else:
-            raise ValueError(f"Unknown optimization type: {optimization_type}")
+        # Collect every circuit first so they share one backend submission
+        circuits = {
+            name: self._optimization_circuit(name, handlers[name][0](params), handlers[name][1])
+            for name, params in requested.items()
+        }
+        configs = self._run_circuits([transpiled for _, transpiled in circuits.values()])
+        
+        results = {
+            name: handlers[name][2](params, circuits[name][0], optimal_config)
+            for (name, params), optimal_config in zip(requested.items(), configs)
+        }
+        result = results if optimization_type == "all_optimization" else results[optimization_type]
             
         # Store results
-        self.optimization_results[job_id] = result
+        with self._state_lock:
+            self.optimization_results[job_id] = result
         
         # Return results with job ID
         return {
@@ -546,29 +712,57 @@ class QuantumComputingEngine:
             "results": result
         }
     
-    def _optimize_transactions(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize transaction processing using quantum algorithms"""
-        # Extract parameters
-        tx_count = parameters.get("txCount", 100)
-        block_size = parameters.get("blockSize", 5)
-        network_load = parameters.get("networkLoad", 0.5)
-        fee = parameters.get("fee", 0.005)
-        
+    def _optimization_circuit(self, optimization_type: str, num_qubits: int,
+                              build) -> Tuple[Dict[str, int], "QuantumCircuit"]:
+        """Reported stats and transpiled form of an optimization circuit, built once"""
+        # The circuits depend only on their width; every angle is a constant,
+        # and so are the depth and gate count reported with each result
+        key = (optimization_type, num_qubits)
+        cached = self._circuit_cache.get(key)
+        if cached is None:
+            circuit = build(num_qubits)
+            circuit_stats = {
+                "quantum_circuit_depth": circuit.depth(),
+                "quantum_gate_count": sum(circuit.count_ops().values())
+            }
+            transpiled = transpile(circuit, self._backend_for(num_qubits), optimization_level=1)
+            cached = self._circuit_cache[key] = (circuit_stats, transpiled)
+        return cached
+    
+    def _run_circuits(self, circuits: List["QuantumCircuit"]) -> List[str]:
+        """Execute transpiled circuits as one job and return the most frequent result of each"""
+        backend = self._backend_for(max(circuit.num_qubits for circuit in circuits))
+        
+        # One job shares the submission and simulator setup across circuits
+        result = backend.run(circuits).result()
+        
+        # The first most frequent outcome, taken from the raw hex-keyed counts
+        # so only that one key is formatted as a bitstring; get_counts would
+        # format every key. Each circuit has a single classical register
+        configs = []
+        for i, circuit in enumerate(circuits):
+            counts = result.data(i)["counts"]
+            configs.append(format(int(max(counts, key=counts.get), 16), f'0{circuit.num_clbits}b'))
+        return configs
+    
+    def _transactions_qubits(self, parameters: Dict[str, Any]) -> int:
+        """Number of qubits of the transaction optimization circuit"""
+        return 4  # Simplified for demonstration
+    
+    def _build_transactions_circuit(self, num_qubits: int) -> "QuantumCircuit":
+        """Build the transaction optimization circuit"""
         # Create a quantum circuit for Grover's algorithm
         # This is a simplified example - in practice, you would create a circuit
         # that represents your specific optimization problem
         
-        # Define the number of qubits needed
-        num_qubits = 4  # Simplified for demonstration
-        
         # Create quantum and classical registers
         qr = QuantumRegister(num_qubits, 'q')
         cr = ClassicalRegister(num_qubits, 'c')
         circuit = QuantumCircuit(qr, cr)
         
-        # Apply Hadamard gates to create superposition
-        for i in range(num_qubits):
-            circuit.h(qr[i])
+        # Apply Hadamard gates to create superposition; single-qubit gates are
+        # broadcast over the whole register in one call
+        circuit.h(qr)
             
         # Apply oracle (simplified)
         # In a real scenario, this would encode the transaction optimization problem
@@ -576,27 +770,27 @@ class QuantumComputingEngine:
         circuit.cz(qr[2], qr[3])
         
         # Apply diffusion operator (simplified)
-        for i in range(num_qubits):
-            circuit.h(qr[i])
-            circuit.x(qr[i])
+        circuit.h(qr)
+        circuit.x(qr)
         
         circuit.cz(qr[0], qr[1])
         
-        for i in range(num_qubits):
-            circuit.x(qr[i])
-            circuit.h(qr[i])
+        circuit.x(qr)
+        circuit.h(qr)
             
         # Measure qubits
         circuit.measure(qr, cr)
         
-        # Execute the circuit
-        job = execute(circuit, self.backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts(circuit)
-        
-        # Get the most frequent result
-        max_count = max(counts.items(), key=lambda x: x[1])
-        optimal_config = max_count[0]
+        return circuit
+    
+    def _transactions_result(self, parameters: Dict[str, Any], circuit_stats: Dict[str, int],
+                             optimal_config: str) -> Dict[str, Any]:
+        """Optimize transaction processing from the most frequent measured result"""
+        # Extract parameters
+        tx_count = parameters.get("txCount", 100)
+        block_size = parameters.get("blockSize", 5)
+        network_load = parameters.get("networkLoad", 0.5)
+        fee = parameters.get("fee", 0.005)
         
         # Convert binary string to parameters
         optimal_block_size = block_size * (1 + int(optimal_config[0]) * 0.2)
@@ -618,27 +812,20 @@ class QuantumComputingEngine:
                 "blockSize": optimal_block_size,
                 "fee": optimal_fee,
                 "estimatedProcessingTime": processing_time,
-                "quantum_circuit_depth": circuit.depth(),
-                "quantum_gate_count": sum(circuit.count_ops().values())
+                **circuit_stats
             }
         }
     
-    def _optimize_contours(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize geometric contours using quantum algorithms"""
-        # Extract parameters
+    def _contours_qubits(self, parameters: Dict[str, Any]) -> int:
+        """Number of qubits of the contour optimization circuit"""
         dimensions = parameters.get("dimensions", 3)
-        points = parameters.get("points", 50)
-        complexity = parameters.get("complexity", 50)
-        curvature = parameters.get("curvature", 0.8)
-        length = parameters.get("length", 250)
-        iterations = parameters.get("iterations", 25)
-        
+        return min(dimensions * 2, 10)  # Simplified for demonstration
+    
+    def _build_contours_circuit(self, num_qubits: int) -> "QuantumCircuit":
+        """Build the contour optimization circuit"""
         # Create a QAOA circuit for contour optimization
         # This is a simplified example
         
-        # Define the number of qubits needed
-        num_qubits = min(dimensions * 2, 10)  # Simplified for demonstration
-        
         # Create quantum circuit for QAOA
         qr = QuantumRegister(num_qubits, 'q')
         cr = ClassicalRegister(num_qubits, 'c')
@@ -660,21 +847,27 @@ class QuantumComputingEngine:
         # Measure qubits
         circuit.measure(qr, cr)
         
-        # Execute the circuit
-        job = execute(circuit, self.backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts(circuit)
-        
-        # Get the most frequent result
-        max_count = max(counts.items(), key=lambda x: x[1])
-        optimal_config = max_count[0]
+        return circuit
+    
+    def _contours_result(self, parameters: Dict[str, Any], circuit_stats: Dict[str, int],
+                         optimal_config: str) -> Dict[str, Any]:
+        """Optimize geometric contours from the most frequent measured result"""
+        # Extract parameters
+        dimensions = parameters.get("dimensions", 3)
+        points = parameters.get("points", 50)
+        complexity = parameters.get("complexity", 50)
+        curvature = parameters.get("curvature", 0.8)
+        length = parameters.get("length", 250)
+        iterations = parameters.get("iterations", 25)
         
-        # Convert binary string to parameters
-        optimal_points = points * (1 + sum(int(bit) for bit in optimal_config[:3]) * 0.05)
-        optimal_curvature = curvature * (1 - sum(int(bit) for bit in optimal_config[3:6]) * 0.02)
+        # Convert binary string to parameters; count('1') is a C-level popcount
+        optimal_points = points * (1 + optimal_config[:3].count('1') * 0.05)
+        optimal_curvature = curvature * (1 - optimal_config[3:6].count('1') * 0.02)
         
-        # Calculate estimated processing time and complexity
-        processing_time = (optimal_points / 100) * (dimensions ** 1.5) * iterations / 10
+        # Calculate estimated processing time and complexity; the time per
+        # point is shared by the original and optimized estimates
+        time_per_point = (dimensions ** 1.5) * iterations / 1000
+        processing_time = optimal_points * time_per_point
         optimized_complexity = complexity * 0.85
         
         # Return optimization results
@@ -686,36 +879,26 @@ class QuantumComputingEngine:
                 "curvature": curvature,
                 "length": length,
                 "iterations": iterations,
-                "processingTime": (points / 100) * (dimensions ** 1.5) * iterations / 10
+                "processingTime": points * time_per_point
             },
             "optimized": {
                 "points": optimal_points,
                 "curvature": optimal_curvature,
                 "estimatedComplexity": optimized_complexity,
                 "estimatedProcessingTime": processing_time,
-                "quantum_circuit_depth": circuit.depth(),
-                "quantum_gate_count": sum(circuit.count_ops().values())
+                **circuit_stats
             }
         }
     
-    def _optimize_network(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize network performance using quantum algorithms"""
-        # Extract parameters
-        node_count = parameters.get("nodeCount", 25)
-        connections = parameters.get("connections", 50)
-        avg_latency = parameters.get("avgLatency", 25)
-        tx_pool_size = parameters.get("txPoolSize", 500)
-        block_size = parameters.get("blockSize", 5)
-        hash_rate = parameters.get("hashRate", 500)
-        difficulty = parameters.get("difficulty", 5)
-        propagation_time = parameters.get("propagationTime", 100)
-        
+    def _network_qubits(self, parameters: Dict[str, Any]) -> int:
+        """Number of qubits of the network optimization circuit"""
+        return min(8, 10)  # Simplified for demonstration
+    
+    def _build_network_circuit(self, num_qubits: int) -> "QuantumCircuit":
+        """Build the network optimization circuit"""
         # Create a VQE circuit for network optimization
         # This is a simplified example
         
-        # Define the number of qubits needed
-        num_qubits = min(8, 10)  # Simplified for demonstration
-        
         # Create quantum circuit for VQE
         qr = QuantumRegister(num_qubits, 'q')
         cr = ClassicalRegister(num_qubits, 'c')
@@ -738,24 +921,35 @@ class QuantumComputingEngine:
         # Measure qubits
         circuit.measure(qr, cr)
         
-        # Execute the circuit
-        job = execute(circuit, self.backend, shots=1024)
-        result = job.result()
-        counts = result.get_counts(circuit)
-        
-        # Get the most frequent result
-        max_count = max(counts.items(), key=lambda x: x[1])
-        optimal_config = max_count[0]
+        return circuit
+    
+    def _network_result(self, parameters: Dict[str, Any], circuit_stats: Dict[str, int],
+                        optimal_config: str) -> Dict[str, Any]:
+        """Optimize network performance from the most frequent measured result"""
+        # Extract parameters
+        node_count = parameters.get("nodeCount", 25)
+        connections = parameters.get("connections", 50)
+        avg_latency = parameters.get("avgLatency", 25)
+        tx_pool_size = parameters.get("txPoolSize", 500)
+        block_size = parameters.get("blockSize", 5)
+        hash_rate = parameters.get("hashRate", 500)
+        difficulty = parameters.get("difficulty", 5)
+        propagation_time = parameters.get("propagationTime", 100)
         
         # Convert binary string to parameters
         optimal_connections = connections * (1 + int(optimal_config[0:2], 2) * 0.05)
         optimal_latency = avg_latency * (1 - int(optimal_config[2:4], 2) * 0.05)
         optimal_propagation_time = propagation_time * (1 - int(optimal_config[4:6], 2) * 0.05)
         
+        # Terms shared by the original and optimized estimates
+        pool_throughput = tx_pool_size * 1000 * (block_size / 5)
+        base_efficiency = 0.5 + (hash_rate / 1000) * (1 / difficulty) * 0.1
+        connection_weight = 0.2 / node_count
+        
         # Calculate estimated metrics
-        throughput = tx_pool_size / (optimal_propagation_time / 1000) * (block_size / 5)
-        efficiency = min(0.95, 0.5 + (hash_rate / 1000) * (1 / difficulty) * 0.1)
-        reliability = min(0.99, 0.8 + (optimal_connections / node_count) * 0.2)
+        throughput = pool_throughput / optimal_propagation_time
+        efficiency = min(0.95, base_efficiency)
+        reliability = min(0.99, 0.8 + optimal_connections * connection_weight)
         
         # Return optimization results
         return {
@@ -768,9 +962,9 @@ class QuantumComputingEngine:
                 "hashRate": hash_rate,
                 "difficulty": difficulty,
                 "propagationTime": propagation_time,
-                "throughput": tx_pool_size / (propagation_time / 1000) * (block_size / 5),
-                "efficiency": min(0.9, 0.5 + (hash_rate / 1000) * (1 / difficulty) * 0.1),
-                "reliability": min(0.95, 0.8 + (connections / node_count) * 0.2)
+                "throughput": pool_throughput / propagation_time,
+                "efficiency": min(0.9, base_efficiency),
+                "reliability": min(0.95, 0.8 + connections * connection_weight)
             },
             "optimized": {
                 "connections": optimal_connections,
@@ -779,8 +973,7 @@ class QuantumComputingEngine:
                 "estimatedThroughput": throughput,
                 "estimatedEfficiency": efficiency,
                 "estimatedReliability": reliability,
-                "quantum_circuit_depth": circuit.depth(),
-                "quantum_gate_count": sum(circuit.count_ops().values())
+                **circuit_stats
             }
         }
 
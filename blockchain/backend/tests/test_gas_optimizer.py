@@ -0,0 +1,113 @@
+import pytest
+
+from gas_optimizer import GasOptimizer
+
+BASE_FUNCTION_GAS = 21000
+
+STATE_STRINGS_CONTRACT = """
+contract Token {
+    string public name;
+    string public symbol;
+
+    function f() public {
+    }
+
+    function g(uint256 n) public {
+        for (uint256 i = 0; i < items.length; i++) {
+            total = total + items[i];
+        }
+    }
+}
+"""
+
+STATE_STRINGS_ONLY_CONTRACT = """
+contract Token {
+    string public name;
+    string public symbol;
+
+    function f() public {
+    }
+}
+"""
+
+MIXED_CONTRACT = """
+contract Vault {
+    string public label;
+    uint256 count = 0;
+
+    function deposit(uint256 amount) public payable {
+        uint256 fee = 0;
+        require(amount > 0);
+        balances[msg.sender] = balances[msg.sender] + amount;
+        emit Deposit(msg.sender, amount);
+    }
+
+    function owner() public view returns (address) {
+        return _owner;
+    }
+
+    function sweep(address[] memory accounts) external {
+        for (uint256 i = 0; i < accounts.length; i++) {
+            token.transfer(accounts[i], balances[accounts[i]]);
+        }
+    }
+}
+"""
+
+OVERLOADED_CONTRACT = """
+contract Overloads {
+    string public name;
+
+    function pay(uint256 amount) public {
+        uint256 paid = 0;
+        paid = amount;
+    }
+
+    function pay(uint256 amount, address to) public {
+        require(amount > 0);
+    }
+}
+"""
+
+CONTRACTS = [STATE_STRINGS_CONTRACT, STATE_STRINGS_ONLY_CONTRACT, MIXED_CONTRACT, OVERLOADED_CONTRACT]
+
+def _assert_consistent(analysis):
+    gas_usage = analysis["gas_usage"]
+    assert gas_usage["total"] == sum(gas_usage["by_function"].values())
+    assert all(gas >= BASE_FUNCTION_GAS for gas in gas_usage["by_function"].values())
+
+@pytest.mark.parametrize("contract", CONTRACTS)
+@pytest.mark.parametrize("level", ["minimal", "balanced", "aggressive"])
+def test_derived_analysis_matches_reanalysis(contract, level):
+    derived = GasOptimizer().optimize_contract(contract, level, reanalyze=False)
+    reanalyzed = GasOptimizer().optimize_contract(contract, level, reanalyze=True)
+    
+    assert derived == reanalyzed
+    _assert_consistent(derived["optimized_analysis"])
+
+def test_reanalysis_is_the_default():
+    optimizer = GasOptimizer()
+    
+    result = optimizer.optimize_contract(STATE_STRINGS_CONTRACT, "aggressive")
+    
+    assert result == optimizer.optimize_contract(STATE_STRINGS_CONTRACT, "aggressive", reanalyze=True)
+
+def test_state_variable_rewrites_keep_function_gas():
+    result = GasOptimizer().optimize_contract(STATE_STRINGS_ONLY_CONTRACT, "aggressive", reanalyze=False)
+    
+    assert "string private name" in result["optimized_code"]
+    assert result["optimized_analysis"]["gas_usage"] == {"total": BASE_FUNCTION_GAS, "by_function": {"f": BASE_FUNCTION_GAS}}
+
+def test_suggestions_reflect_optimized_code():
+    result = GasOptimizer().optimize_contract(MIXED_CONTRACT, "aggressive", reanalyze=False)
+    
+    # The only uint256 in deposit is rewritten, so its smaller-integer
+    # suggestion must not be carried over from the original analysis
+    assert "deposit" in {entry["function"] for entry in result["original_analysis"]["suggestions"]}
+    assert "deposit" not in {entry["function"] for entry in result["optimized_analysis"]["suggestions"]}
+
+def test_overloads_sum_into_total():
+    analysis = GasOptimizer().analyze_contract(OVERLOADED_CONTRACT)
+    
+    assert analysis["function_count"] == 2
+    _assert_consistent(analysis)
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+pytest.importorskip("qiskit")
+pytest.importorskip("cachetools")
+
+from quantum_integration import QuantumComputingEngine, TRAINING_STATUS_LIMITS
+
+TRAINING_DATA = {"inputs": [[0.0, 1.0], [1.0, 0.0]], "outputs": [0, 1]}
+
+@pytest.fixture
+def engine():
+    engine = QuantumComputingEngine(use_gpu=False)
+    yield engine
+    engine._training_executor.shutdown(wait=True)
+
+def _blocked_training(engine, error=None):
+    """Make classifier training wait for the returned event, then finish or raise"""
+    release = threading.Event()
+    
+    def train(x_train, y_train, training_data, job_id):
+        release.wait(timeout=30)
+        if error is not None:
+            raise error
+        return object(), {"accuracy": 1.0}
+    
+    engine._train_quantum_classifier = train
+    return release
+
+def _fill_status_cache(engine):
+    for i in range(TRAINING_STATUS_LIMITS[0] + 10):
+        engine._set_training_status(f"finished_{i}", status="completed", progress=100)
+
+@pytest.mark.parametrize("error, final_status", [(None, "completed"), (RuntimeError("boom"), "failed")])
+def test_pending_job_survives_status_cache_eviction(engine, error, final_status):
+    release = _blocked_training(engine, error)
+    job_id = engine.train_quantum_model("quantum_classifier", TRAINING_DATA)["job_id"]
+    
+    _fill_status_cache(engine)
+    
+    assert engine.get_training_status(job_id)["status"] in ("started", "training")
+    
+    release.set()
+    engine._training_executor.shutdown(wait=True)
+    
+    status = engine.get_training_status(job_id)
+    assert status["status"] == final_status
+    assert len(engine.training_status) <= TRAINING_STATUS_LIMITS[0]
+
+def test_finished_jobs_leave_the_active_store(engine):
+    release = _blocked_training(engine)
+    job_id = engine.train_quantum_model("quantum_classifier", TRAINING_DATA)["job_id"]
+    release.set()
+    engine._training_executor.shutdown(wait=True)
+    
+    assert job_id not in engine._active_training
+    assert engine.get_training_status(job_id)["training_time"] >= 0
@@ -125,6 +125,26 @@ public class BlockchainController {
         return ResponseEntity.ok(response);
     }
     
+    /**
+     * Verify a batch of transactions in one request
+     */
+    @PostMapping("/transactions/verify-batch")
+    public ResponseEntity<Map<String, Object>> verifyTransactions(@RequestBody VerifyTransactionsRequest request) {
+        List<Map<String, Object>> results = new ArrayList<>();
+        
+        for (TransactionVerification verification : request.getTransactions()) {
+            Map<String, Object> result = new HashMap<>();
+            result.put("hash", verification.getHash());
+            result.put("verified", transactionProcessor.verifyTransaction(verification.getHash()));
+            results.add(result);
+        }
+        
+        Map<String, Object> response = new HashMap<>();
+        response.put("results", results);
+        
+        return ResponseEntity.ok(response);
+    }
+    
     /**
      * Get transaction details
      */
@@ -366,6 +386,25 @@ public class BlockchainController {
         public void setMinerAddress(String minerAddress) { this.minerAddress = minerAddress; }
     }
     
+    public static class VerifyTransactionsRequest {
+        private List<TransactionVerification> transactions = new ArrayList<>();
+        
+        // Getters and setters
+        public List<TransactionVerification> getTransactions() { return transactions; }
+        public void setTransactions(List<TransactionVerification> transactions) { this.transactions = transactions; }
+    }
+    
+    public static class TransactionVerification {
+        private String hash;
+        private boolean verified;
+        
+        // Getters and setters
+        public String getHash() { return hash; }
+        public void setHash(String hash) { this.hash = hash; }
+        public boolean isVerified() { return verified; }
+        public void setVerified(boolean verified) { this.verified = verified; }
+    }
+    
     public static class VerifyContourRequest {
         private List<List<Double>> points;
         private String algorithm;
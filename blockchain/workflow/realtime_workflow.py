@@ -4,7 +4,8 @@ Kontour Coin Real-time Workflow Integration
 Connects Java and Python backends for real-time blockchain processing
 """
 
-import requests
+import httpx
+import asyncio
 import json
 import time
 import base64
@@ -18,6 +19,21 @@ import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+# NumPy draws random contours in one call; fall back to the random module
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# orjson encodes and parses request bodies several times faster than the
+# json module; fall back to httpx's own JSON handling
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,27 +42,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger("kontourcoin-workflow")
 
+# httpx logs every request at INFO; keep only its warnings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 # Default backend URLs
 PYTHON_BACKEND_URL = "http://localhost:8000"
 JAVA_BACKEND_URL = "http://localhost:8080/kontourcoin/api/v1"
 
+# Keep-alive connection pool shared by all workers, so requests reuse open
+# sockets instead of paying a TCP handshake each
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_MAX_RETRIES = 3
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Delay before a verification request is also sent to the next Python
+# backend replica, roughly the p95 latency of a verify call
+HEDGE_DELAY = 0.2
+
+# Placeholder merkle root sent with every mined block
+_MERKLE_B64 = base64.b64encode(hashlib.sha256(b"merkle").digest()).decode()
+
+# Generator for random mining contours
+_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
+# Concurrent per-transaction verifications when the batch endpoint is not
+# available; kept below the keep-alive pool size
+VERIFY_CONCURRENCY = 16
+
+# Most transactions the Python backend verifies in one batch request
+VERIFY_BATCH_SIZE = 256
+
+def _parse_json(response: httpx.Response) -> Any:
+    """
+    Parse the JSON body of a backend response
+    
+    Args:
+        response: Backend response
+    
+    Returns:
+        Decoded JSON body
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
 class KontourCoinWorkflow:
     """
     Manages real-time workflow between Java and Python backends
     """
     
-    def __init__(self, python_url: str, java_url: str):
+    def __init__(self, python_url: str, java_url: str, python_replica_urls: Optional[List[str]] = None):
         """
         Initialize the workflow manager
         
         Args:
             python_url: URL of the Python backend
             java_url: URL of the Java backend
+            python_replica_urls: URLs of Python backend replicas that slow
+                verification requests are hedged to
         """
         self.python_url = python_url
         self.java_url = java_url
+        self.python_replica_urls = python_replica_urls or []
         self.running = False
-        self.threads = []
+        self.loop = None
+        self.thread = None
+        self.tasks = []
+        self.client = None
         self.stats = {
             "transactions_processed": 0,
             "blocks_mined": 0,
@@ -54,8 +118,27 @@ class KontourCoinWorkflow:
             "sync_errors": 0,
             "start_time": datetime.now().isoformat()
         }
+        # Monotonic start for uptime, unaffected by wall-clock changes
+        self.start_monotonic = time.monotonic()
+        # Sequence number that identifies the data of each mining attempt
+        self.block_seq = 0
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create the pooled HTTP client used for all backend requests
+        
+        Returns:
+            Async client with keep-alive connection pooling and retries
+        """
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=HTTP_MAX_RETRIES)
+        )
     
-    def check_backends(self) -> bool:
+    async def check_backends(self) -> bool:
         """
         Check if both backends are available
         
@@ -64,13 +147,13 @@ class KontourCoinWorkflow:
         """
         try:
             # Check Python backend
-            python_response = requests.get(f"{self.python_url}/", timeout=5)
+            python_response = await self.client.get(f"{self.python_url}/", timeout=5)
             if python_response.status_code != 200:
                 logger.error(f"Python backend returned status code {python_response.status_code}")
                 return False
             
             # Check Java backend
-            java_response = requests.get(f"{self.java_url}/stats", timeout=5)
+            java_response = await self.client.get(f"{self.java_url}/stats", timeout=5)
             if java_response.status_code != 200:
                 logger.error(f"Java backend returned status code {java_response.status_code}")
                 return False
@@ -89,24 +172,40 @@ class KontourCoinWorkflow:
             logger.warning("Workflow manager is already running")
             return
         
-        if not self.check_backends():
+        # All workers run as coroutines on one event loop and share one client
+        self.loop = asyncio.new_event_loop()
+        self.client = self._create_client()
+        
+        if not self.loop.run_until_complete(self.check_backends()):
             logger.error("Cannot start workflow manager: backends not available")
+            self.loop.run_until_complete(self.client.aclose())
+            self.loop.close()
             return
         
         self.running = True
         
-        # Start worker threads
-        self.threads = [
-            threading.Thread(target=self.transaction_sync_worker, daemon=True),
-            threading.Thread(target=self.block_mining_worker, daemon=True),
-            threading.Thread(target=self.stats_reporter, daemon=True)
-        ]
-        
-        for thread in self.threads:
-            thread.start()
+        # Run the event loop on a background thread
+        self.thread = threading.Thread(target=self.loop.run_until_complete, args=(self._run(),), daemon=True)
+        self.thread.start()
         
         logger.info("Workflow manager started")
     
+    async def _run(self):
+        """
+        Run the workers until they are cancelled, then release the client
+        """
+        self.tasks = [
+            asyncio.create_task(self.transaction_sync_worker()),
+            asyncio.create_task(self.block_mining_worker()),
+            asyncio.create_task(self.stats_reporter())
+        ]
+        
+        try:
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+        finally:
+            # Release pooled connections
+            await self.client.aclose()
+    
     def stop(self):
         """
         Stop the workflow manager
@@ -117,104 +216,264 @@ class KontourCoinWorkflow:
         
         self.running = False
         
-        # Wait for threads to finish
-        for thread in self.threads:
-            thread.join(timeout=5)
+        # Wake the workers from their sleeps and wait for the loop to finish
+        for task in self.tasks:
+            self.loop.call_soon_threadsafe(task.cancel)
+        self.thread.join(timeout=5)
+        if not self.thread.is_alive():
+            self.loop.close()
         
         logger.info("Workflow manager stopped")
     
-    def transaction_sync_worker(self):
+    async def transaction_sync_worker(self):
         """
-        Worker thread for transaction synchronization
+        Worker coroutine for transaction synchronization
         """
         logger.info("Transaction sync worker started")
         
         while self.running:
             try:
                 # Get pending transactions from Java backend
-                java_response = requests.get(f"{self.java_url}/transactions/pending", timeout=5)
+                java_response = await self.client.get(f"{self.java_url}/transactions/pending", timeout=5)
                 if java_response.status_code != 200:
                     logger.warning(f"Failed to get pending transactions from Java backend: {java_response.status_code}")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
                 
-                pending_transactions = java_response.json()
+                pending_transactions = _parse_json(java_response)
                 
-                for tx in pending_transactions:
-                    # Verify transaction with Python backend
-                    python_response = requests.post(
-                        f"{self.python_url}/verify-transaction",
-                        json={
-                            "transaction_hash": tx["hash"],
-                            "transaction_data": {
-                                "from_address": tx["fromAddress"],
-                                "to_address": tx["toAddress"],
-                                "amount": tx["amount"],
-                                "timestamp": tx["timestamp"],
-                                "fee": tx["fee"],
-                                "signature": tx["signature"]
-                            }
-                        },
-                        timeout=5
-                    )
-                    
-                    if python_response.status_code != 200:
-                        logger.warning(f"Failed to verify transaction with Python backend: {python_response.status_code}")
-                        continue
-                    
-                    verification_result = python_response.json()
-                    
-                    # Update transaction status in Java backend
-                    java_update_response = requests.post(
-                        f"{self.java_url}/transactions/{tx['hash']}/verify",
-                        json={"verified": verification_result["verified"]},
-                        timeout=5
-                    )
-                    
-                    if java_update_response.status_code != 200:
-                        logger.warning(f"Failed to update transaction status in Java backend: {java_update_response.status_code}")
-                        continue
-                    
-                    self.stats["transactions_processed"] += 1
-                    logger.info(f"Transaction {tx['hash']} verified: {verification_result['verified']}")
+                for start in range(0, len(pending_transactions), VERIFY_BATCH_SIZE):
+                    await self._sync_transactions(pending_transactions[start:start + VERIFY_BATCH_SIZE])
                 
                 # Sleep before next batch
-                time.sleep(10)
+                await asyncio.sleep(10)
             
             except Exception as e:
                 logger.error(f"Error in transaction sync worker: {str(e)}")
                 self.stats["sync_errors"] += 1
-                time.sleep(30)
+                await asyncio.sleep(30)
+    
+    async def _sync_transactions(self, pending_transactions: List[Dict[str, Any]]):
+        """
+        Verify pending transactions with the Python backend and record the
+        results in the Java backend, one batch request to each
+        
+        Args:
+            pending_transactions: Pending transactions from the Java backend
+        """
+        # Verify all transactions with Python backend
+        python_response = await self._hedged_post(
+            "/verify-transactions-batch",
+            [self._verification_request(tx) for tx in pending_transactions],
+            timeout=5
+        )
+        
+        if python_response.status_code != 200:
+            logger.warning(f"Failed to verify transactions in batch with Python backend: {python_response.status_code}, "
+                           f"verifying individually")
+            await self._sync_transactions_individually(pending_transactions)
+            return
+        
+        verification_results = []
+        for result in _parse_json(python_response):
+            # Transactions the backend could not verify stay pending and are
+            # retried on the next sync
+            if result.get("error"):
+                logger.warning(f"Failed to verify transaction {result['transaction_hash']}: {result['error']}")
+                continue
+            verification_results.append({"hash": result["transaction_hash"], "verified": result["verified"]})
+        
+        if not verification_results:
+            return
+        
+        # Update transaction statuses in Java backend
+        java_update_response = await self._post_json(
+            f"{self.java_url}/transactions/verify-batch",
+            {"transactions": verification_results},
+            timeout=5
+        )
+        
+        if java_update_response.status_code != 200:
+            logger.warning(f"Failed to update transaction statuses in Java backend: {java_update_response.status_code}")
+            return
+        
+        self.stats["transactions_processed"] += len(verification_results)
+        for result in verification_results:
+            logger.info(f"Transaction {result['hash']} verified: {result['verified']}")
+    
+    async def _sync_transactions_individually(self, pending_transactions: List[Dict[str, Any]]):
+        """
+        Verify and update pending transactions one request each, with the
+        requests for different transactions in flight concurrently
+        
+        Args:
+            pending_transactions: Pending transactions from the Java backend
+        """
+        semaphore = asyncio.Semaphore(VERIFY_CONCURRENCY)
+        
+        async def sync(tx: Dict[str, Any]) -> bool:
+            async with semaphore:
+                return await self._sync_transaction(tx)
+        
+        for synced in await asyncio.gather(*(sync(tx) for tx in pending_transactions)):
+            if synced:
+                self.stats["transactions_processed"] += 1
+    
+    async def _sync_transaction(self, tx: Dict[str, Any]) -> bool:
+        """
+        Verify a transaction with the Python backend and record the result
+        in the Java backend
+        
+        Args:
+            tx: Transaction from the Java backend
+        
+        Returns:
+            True if the transaction was verified and updated, False otherwise
+        """
+        # Verify transaction with Python backend
+        python_response = await self._hedged_post(
+            "/verify-transaction",
+            self._verification_request(tx),
+            timeout=5
+        )
+        
+        if python_response.status_code != 200:
+            logger.warning(f"Failed to verify transaction with Python backend: {python_response.status_code}")
+            return False
+        
+        verification_result = _parse_json(python_response)
+        
+        # Update transaction status in Java backend
+        java_update_response = await self._post_json(
+            f"{self.java_url}/transactions/{tx['hash']}/verify",
+            {"verified": verification_result["verified"]},
+            timeout=5
+        )
+        
+        if java_update_response.status_code != 200:
+            logger.warning(f"Failed to update transaction status in Java backend: {java_update_response.status_code}")
+            return False
+        
+        logger.info(f"Transaction {tx['hash']} verified: {verification_result['verified']}")
+        return True
+    
+    async def _post_json(self, url: str, body: Any, timeout: float) -> httpx.Response:
+        """
+        POST a JSON body, encoded with orjson when it is available
+        
+        Args:
+            url: Request URL
+            body: JSON request body
+            timeout: Request timeout
+        
+        Returns:
+            Backend response
+        """
+        if ORJSON_AVAILABLE:
+            return await self.client.post(url, content=orjson.dumps(body), headers=JSON_HEADERS, timeout=timeout)
+        return await self.client.post(url, json=body, timeout=timeout)
+    
+    async def _hedged_post(self, path: str, body: Any, timeout: float) -> httpx.Response:
+        """
+        Send a verification request to the Python backend, hedged across its
+        replicas: each time HEDGE_DELAY passes (or a request fails) without a
+        response, the request is also sent to the next replica. The first
+        response wins and the requests still in flight are cancelled. Only
+        for requests that do not change backend state
+        
+        Args:
+            path: Request path on the Python backend
+            body: JSON request body
+            timeout: Timeout of each request
+        
+        Returns:
+            First response received
+        """
+        if not self.python_replica_urls:
+            return await self._post_json(f"{self.python_url}{path}", body, timeout)
+        
+        pending = set()
+        error = None
+        
+        def first_response(done):
+            nonlocal error
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+            return None
+        
+        try:
+            for url in [self.python_url] + self.python_replica_urls:
+                pending.add(asyncio.create_task(self._post_json(f"{url}{path}", body, timeout)))
+                done, pending = await asyncio.wait(pending, timeout=HEDGE_DELAY, return_when=asyncio.FIRST_COMPLETED)
+                response = first_response(done)
+                if response is not None:
+                    return response
+            
+            # Every replica has been tried; wait for whichever answers first
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                response = first_response(done)
+                if response is not None:
+                    return response
+            
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
     
-    def block_mining_worker(self):
+    def _verification_request(self, tx: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Worker thread for block mining
+        Build the Python backend verification request for a transaction
+        
+        Args:
+            tx: Transaction from the Java backend
+        
+        Returns:
+            Verification request body
+        """
+        return {
+            "transaction_hash": tx["hash"],
+            "transaction_data": {
+                "from_address": tx["fromAddress"],
+                "to_address": tx["toAddress"],
+                "amount": tx["amount"],
+                "timestamp": tx["timestamp"],
+                "fee": tx["fee"],
+                "signature": tx["signature"]
+            }
+        }
+    
+    async def block_mining_worker(self):
+        """
+        Worker coroutine for block mining
         """
         logger.info("Block mining worker started")
         
         while self.running:
             try:
                 # Check if there are enough pending transactions
-                java_response = requests.get(f"{self.java_url}/stats", timeout=5)
+                java_response = await self.client.get(f"{self.java_url}/stats", timeout=5)
                 if java_response.status_code != 200:
                     logger.warning(f"Failed to get stats from Java backend: {java_response.status_code}")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
                 
-                stats = java_response.json()
+                stats = _parse_json(java_response)
                 
                 if stats.get("pendingTransactions", 0) < 1:
                     logger.info("Not enough pending transactions for mining")
-                    time.sleep(30)
+                    await asyncio.sleep(30)
                     continue
                 
                 # Generate contour for mining
                 contour_points = self.generate_random_contour(10, 3)
                 
                 # Verify contour with Python backend
-                python_response = requests.post(
-                    f"{self.python_url}/verify-contour",
-                    json={
+                python_response = await self._hedged_post(
+                    "/verify-contour",
+                    {
                         "miner_address": "0x1234567890123456789012345678901234567890",
                         "contour_points": contour_points,
                         "algorithm": "bezier"
@@ -224,36 +483,38 @@ class KontourCoinWorkflow:
                 
                 if python_response.status_code != 200:
                     logger.warning(f"Failed to verify contour with Python backend: {python_response.status_code}")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
                 
-                contour_result = python_response.json()
+                contour_result = _parse_json(python_response)
                 self.stats["contours_verified"] += 1
                 
                 if not contour_result.get("verified", False):
                     logger.info("Contour verification failed, generating new contour")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
                 
                 # Find valid nonce
+                block_data = f"Block {self.block_seq}"
+                self.block_seq += 1
                 nonce = self.find_valid_nonce(
-                    f"Block {datetime.now().isoformat()}",
+                    block_data,
                     contour_result["hash"],
                     stats.get("difficulty", 4)
                 )
                 
                 if nonce is None:
                     logger.info("Failed to find valid nonce, trying again")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
                 
                 # Mine block with Java backend
-                java_mine_response = requests.post(
+                java_mine_response = await self._post_json(
                     f"{self.java_url}/mine",
-                    json={
-                        "data": f"Block {datetime.now().isoformat()}",
+                    {
+                        "data": block_data,
                         "nonce": nonce,
-                        "merkleRoot": base64.b64encode(hashlib.sha256(b"merkle").digest()).decode(),
+                        "merkleRoot": _MERKLE_B64,
                         "contourHash": contour_result["hash"],
                         "contourComplexity": contour_result["complexity"],
                         "minerAddress": "0x1234567890123456789012345678901234567890"
@@ -263,31 +524,31 @@ class KontourCoinWorkflow:
                 
                 if java_mine_response.status_code != 200:
                     logger.warning(f"Failed to mine block with Java backend: {java_mine_response.status_code}")
-                    time.sleep(5)
+                    await asyncio.sleep(5)
                     continue
                 
-                block_result = java_mine_response.json()
+                block_result = _parse_json(java_mine_response)
                 self.stats["blocks_mined"] += 1
                 logger.info(f"Block mined: {block_result.get('block', {}).get('index')}")
                 
                 # Sleep before mining next block
-                time.sleep(60)
+                await asyncio.sleep(60)
             
             except Exception as e:
                 logger.error(f"Error in block mining worker: {str(e)}")
                 self.stats["sync_errors"] += 1
-                time.sleep(30)
+                await asyncio.sleep(30)
     
-    def stats_reporter(self):
+    async def stats_reporter(self):
         """
-        Worker thread for reporting statistics
+        Worker coroutine for reporting statistics
         """
         logger.info("Stats reporter started")
         
         while self.running:
             try:
                 # Calculate uptime
-                uptime_seconds = (datetime.now() - datetime.fromisoformat(self.stats["start_time"])).total_seconds()
+                uptime_seconds = time.monotonic() - self.start_monotonic
                 uptime_str = f"{int(uptime_seconds // 3600)}h {int((uptime_seconds % 3600) // 60)}m {int(uptime_seconds % 60)}s"
                 
                 # Log stats
@@ -299,11 +560,11 @@ class KontourCoinWorkflow:
                            f"Errors: {self.stats['sync_errors']}")
                 
                 # Sleep before next report
-                time.sleep(60)
+                await asyncio.sleep(60)
             
             except Exception as e:
                 logger.error(f"Error in stats reporter: {str(e)}")
-                time.sleep(30)
+                await asyncio.sleep(30)
     
     def generate_random_contour(self, num_points: int, dimensions: int) -> List[List[float]]:
         """
@@ -316,6 +577,9 @@ class KontourCoinWorkflow:
         Returns:
             List of points representing the contour
         """
+        if NUMPY_AVAILABLE:
+            return _rng.uniform(-1.0, 1.0, size=(num_points, dimensions)).tolist()
+        
         return [
             [random.uniform(-1.0, 1.0) for _ in range(dimensions)]
             for _ in range(num_points)
@@ -334,13 +598,26 @@ class KontourCoinWorkflow:
             Valid nonce if found, None otherwise
         """
         max_attempts = 1000
-        target_prefix = "0" * difficulty
+        
+        # Any hash has an empty zero prefix, and none has more than 64 digits
+        if difficulty <= 0:
+            return 0
+        if difficulty > 64:
+            return None
+        
+        # A hex digest starting with `difficulty` zeros is a raw digest below
+        # 2 ** (256 - 4 * difficulty); big-endian bytes compare the same way
+        target = (1 << (256 - 4 * difficulty)).to_bytes(32, "big")
+        
+        # Hash the data once and extend a copy of that state per nonce
+        prefix = hashlib.sha256(data.encode())
+        suffix = contour_hash.encode()
         
         for nonce in range(max_attempts):
-            block_data = f"{data}{nonce}{contour_hash}"
-            block_hash = hashlib.sha256(block_data.encode()).hexdigest()
+            block_hash = prefix.copy()
+            block_hash.update(b"%d%b" % (nonce, suffix))
             
-            if block_hash.startswith(target_prefix):
+            if block_hash.digest() < target:
                 return nonce
         
         return None
@@ -352,9 +629,11 @@ def main():
     parser = argparse.ArgumentParser(description="Kontour Coin Real-time Workflow Integration")
     parser.add_argument("--python-url", default=PYTHON_BACKEND_URL, help="URL of the Python backend")
     parser.add_argument("--java-url", default=JAVA_BACKEND_URL, help="URL of the Java backend")
+    parser.add_argument("--python-replica-url", dest="python_replica_urls", action="append", default=[],
+                        help="URL of a Python backend replica to hedge verification requests to (repeatable)")
     args = parser.parse_args()
     
-    workflow = KontourCoinWorkflow(args.python_url, args.java_url)
+    workflow = KontourCoinWorkflow(args.python_url, args.java_url, args.python_replica_urls)
     
     try:
         workflow.start()
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Dict, List, Any, Optional
 from quantum.quantum_circuit import QuantumTransactionVerifier
 from quantum.grover_mining import QuantumMiner
@@ -8,9 +9,11 @@ from quantum.phase_estimation import QuantumPhaseEstimator
 from quantum_circuit_optimizer import QuantumCircuitOptimizer
 from quantum_ml import QuantumMLModel, QuantumMLAlgorithm
 import hashlib
+import itertools
+import threading
 import time
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -100,13 +103,35 @@ estimator = QuantumPhaseEstimator()
 circuit_optimizer = QuantumCircuitOptimizer()
 quantum_ml = QuantumMLModel()
 
+class AtomicCounter:
+    """Counter that can be incremented from any thread without a lock.
+
+    next() on an itertools.count runs entirely in C, so it cannot be
+    interleaved like a read-modify-write of a dict item. Every read also
+    consumes a value, which is tracked in _reads.
+    """
+    def __init__(self):
+        self._count = itertools.count()
+        self._reads = 0
+        self._read_lock = threading.Lock()
+
+    def increment(self):
+        next(self._count)
+
+    @property
+    def value(self) -> int:
+        with self._read_lock:
+            value = next(self._count) - self._reads
+            self._reads += 1
+        return value
+
 # Workflow state
 workflow_running = False
 workflow_stats = {
-    "transactions_processed": 0,
-    "blocks_mined": 0,
-    "sync_errors": 0,
-    "contours_verified": 0
+    "transactions_processed": AtomicCounter(),
+    "blocks_mined": AtomicCounter(),
+    "sync_errors": AtomicCounter(),
+    "contours_verified": AtomicCounter()
 }
 
 @app.post("/verify_transaction")
@@ -122,7 +147,7 @@ async def verify_transaction(request: TransactionRequest):
         
         # Update workflow stats if workflow is running
         if workflow_running:
-            workflow_stats["transactions_processed"] += 1
+            workflow_stats["transactions_processed"].increment()
         
         return {
             "valid": is_valid,
@@ -144,7 +169,7 @@ async def mine_block(request: MiningRequest):
         
         # Update workflow stats if workflow is running
         if workflow_running:
-            workflow_stats["blocks_mined"] += 1
+            workflow_stats["blocks_mined"].increment()
         
         return {
             "nonce": nonce,
@@ -196,7 +221,7 @@ async def get_workflow_status():
 @app.get("/workflow/stats")
 async def get_workflow_stats():
     try:
-        return workflow_stats
+        return {name: counter.value for name, counter in workflow_stats.items()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 